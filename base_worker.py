@@ -6,25 +6,99 @@ Shared functionality for all specialized workers
 
 import time
 import sys
+import logging
 import os
 import threading
 import datetime
-from typing import List, Dict, Any, Optional, Tuple
-from config import WORKER_POLL_INTERVAL, WORKER_MAX_CONCURRENT_JOBS
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, Future
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable
+import httpx
+from config import WORKER_POLL_INTERVAL, WORKER_MAX_CONCURRENT_JOBS, LOG_LEVEL, WORKER_TEMP_DIR
 from supabase_client import SupabaseClient
 
 
+logger = logging.getLogger(__name__)
+
+# Background pool for blocking I/O (saves, downloads) that can overlap other work in a job
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="worker_io")
+
+
+def _is_transient(e: Exception) -> bool:
+    """Whether a failed I/O call may succeed if repeated (connection problems, 5xx responses)"""
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code >= 500
+    if isinstance(e, httpx.TransportError):
+        return True
+    # Missing files stay missing; other OS errors (resets, timeouts, busy disks) can clear up
+    return isinstance(e, OSError) and not isinstance(e, FileNotFoundError)
+
+
+def _call_with_retry(func: Callable, *args, attempts: int = 3, **kwargs):
+    """Call func, retrying transient failures with exponential backoff (1s, 2s, ...)"""
+    for attempt in range(attempts):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if not _is_transient(e) or attempt + 1 >= attempts:
+                raise
+            delay = 2 ** attempt
+            logger.warning("  🔁 %s failed (%s), retrying in %ss...", getattr(func, '__name__', 'I/O'), e, delay)
+            time.sleep(delay)
+
+
 class BaseWorker:
     """Base class for all specialized workers"""
     
     def __init__(self, worker_name: str):
         """Initialize base worker"""
+        # Configure the root logger once per process (no-op if already configured)
+        logging.basicConfig(level=LOG_LEVEL, format="%(message)s", stream=sys.stdout)
         self.worker_name = worker_name
         self.supabase = SupabaseClient()
         self.active_jobs = set()  # Track jobs currently being processed
         self.active_jobs_lock = threading.Lock()  # Lock for thread-safe access
         self.pid = os.getpid()  # Store process ID for display in frontend
-        print(f"🚀 Initializing {worker_name}... (PID: {self.pid})")
+        # Keep-alive HTTP/2 client reused for every download during the worker's lifetime
+        self.http = httpx.Client(
+            http2=True,
+            timeout=60,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            follow_redirects=True
+        )
+        logger.info("🚀 Initializing %s... (PID: %s)", worker_name, self.pid)
+    
+    def submit_io(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Run a blocking I/O call in the background with retry/backoff
+        
+        Returns:
+            Future - call .result() where the value is actually needed
+        """
+        return _IO_POOL.submit(_call_with_retry, func, *args, **kwargs)
+    
+    def job_temp_dir(self, job_id: str) -> tempfile.TemporaryDirectory:
+        """
+        Scratch directory for a job, removed when the with-block exits (even on errors)
+        
+        Lives in WORKER_TEMP_DIR (tmpfs) when possible, otherwise in the system temp dir
+        """
+        prefix = f"yt_{job_id}_"
+        try:
+            return tempfile.TemporaryDirectory(prefix=prefix, dir=WORKER_TEMP_DIR)
+        except OSError:
+            return tempfile.TemporaryDirectory(prefix=prefix)
+    
+    def download_file(self, url: str, output_path: Path) -> Path:
+        """Stream a URL to output_path over the worker's shared HTTP client (1 MiB writes)"""
+        with self.http.stream("GET", url, timeout=httpx.Timeout(300.0, connect=5.0)) as response:
+            response.raise_for_status()
+            with open(output_path, 'wb') as f:
+                for chunk in response.iter_bytes(chunk_size=1024 * 1024):
+                    f.write(chunk)
+        
+        return output_path
     
     def check_dependencies(self, job: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -47,22 +121,32 @@ class BaseWorker:
         """
         raise NotImplementedError("Subclasses must implement process_job")
     
-    def get_pending_jobs(self, action_needed: str) -> List[Dict[str, Any]]:
+    def get_pending_jobs(self, action_needed: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get pending jobs that need this worker's action
         
         Args:
             action_needed: The action this worker handles (e.g., 'generate_script')
+            limit: Maximum number of jobs to claim (default: WORKER_MAX_CONCURRENT_JOBS)
         
         Returns:
-            List of jobs ready to be processed
+            List of claimed jobs ready to be processed
         """
-        # Get all pending jobs
-        all_jobs = self.supabase.get_pending_jobs(limit=WORKER_MAX_CONCURRENT_JOBS * 10)
+        limit = limit or WORKER_MAX_CONCURRENT_JOBS
+        
+        # Get pending jobs that need this action (filtered server-side on metadata->>action_needed)
+        all_jobs = self.supabase.get_pending_jobs(
+            limit=limit * 10,
+            action_needed=action_needed
+        )
         
         # Filter jobs that need this action
         ready_jobs = []
         for job in all_jobs:
+            # Stop once we've claimed as many jobs as we can run
+            if len(ready_jobs) >= limit:
+                break
+            
             # Skip jobs that are already being processed (not pending or ready)
             # "ready" status means all steps complete except YouTube upload
             if job.get("status") not in ["pending", "ready"]:
@@ -111,9 +195,9 @@ class BaseWorker:
                         if updated:
                             ready_jobs.append(job)
                         else:
-                            print(f"  ⚠️  Job {job['id'][:8]} already claimed by another worker")
+                            logger.warning("  ⚠️  Job %s already claimed by another worker", job['id'][:8])
                     except Exception as e:
-                        print(f"  ⚠️  Failed to claim job {job['id'][:8]}: {e}")
+                        logger.warning("  ⚠️  Failed to claim job %s: %s", job['id'][:8], e)
                 else:
                     # Update job with missing dependencies info
                     current_metadata = job.get("metadata", {})
@@ -125,37 +209,37 @@ class BaseWorker:
                         error_message=f"Missing dependencies: {', '.join(missing)}"
                     )
         
-        return ready_jobs[:WORKER_MAX_CONCURRENT_JOBS]
+        return ready_jobs
     
     def _process_job_thread(self, job: Dict[str, Any], action_needed: str):
         """Process a single job in a separate thread"""
         job_id = job["id"]
         try:
-            print(f"\n{'='*60}")
-            print(f"📹 {self.worker_name} processing Job: {job_id[:8]}...")
-            print(f"{'='*60}")
+            logger.info("=" * 60)
+            logger.info("📹 %s processing Job: %s...", self.worker_name, job_id[:8])
+            logger.info("=" * 60)
             self.process_job(job)
         except Exception as e:
-            print(f"\n❌ {self.worker_name} error processing job {job_id[:8]}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ %s error processing job %s: %s", self.worker_name, job_id[:8], e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
         finally:
             # Remove from active jobs when done
             with self.active_jobs_lock:
                 self.active_jobs.discard(job_id)
     
-    def run(self, action_needed: str):
+    def run(self, action_needed: str, max_concurrent: Optional[int] = None):
         """
         Main worker loop - polls for jobs and processes them in parallel
         
         Args:
             action_needed: The action this worker handles
+            max_concurrent: Jobs processed at once (default: WORKER_MAX_CONCURRENT_JOBS)
         """
-        max_concurrent = max(1, WORKER_MAX_CONCURRENT_JOBS)  # At least 1
-        print(f"\n🔄 {self.worker_name} started - polling every {WORKER_POLL_INTERVAL} seconds")
-        print(f"   Looking for jobs with action: {action_needed}")
-        print(f"   Max concurrent jobs: {max_concurrent}")
-        print(f"   Press Ctrl+C to stop\n")
+        max_concurrent = max(1, max_concurrent or WORKER_MAX_CONCURRENT_JOBS)  # At least 1
+        logger.info("🔄 %s started - polling every %s seconds", self.worker_name, WORKER_POLL_INTERVAL)
+        logger.info("   Looking for jobs with action: %s", action_needed)
+        logger.info("   Max concurrent jobs: %s", max_concurrent)
+        logger.info("   Press Ctrl+C to stop")
         
         # Send initial heartbeat by updating a dummy job's metadata
         # This helps the frontend detect that workers are running
@@ -189,7 +273,7 @@ class BaseWorker:
                             pass
                     except Exception as e:
                         # Don't fail if heartbeat update fails - just log it
-                        print(f"  ⚠️  Heartbeat update failed (non-critical): {e}")
+                        logger.warning("  ⚠️  Heartbeat update failed (non-critical): %s", e)
                     last_heartbeat = current_time
                 
                 # Check how many jobs we can start
@@ -198,7 +282,7 @@ class BaseWorker:
                 
                 if available_slots > 0:
                     # Get jobs ready for this worker (up to available slots)
-                    jobs = self.get_pending_jobs(action_needed)
+                    jobs = self.get_pending_jobs(action_needed, limit=available_slots)
                     
                     # Filter out jobs already being processed
                     with self.active_jobs_lock:
@@ -217,21 +301,20 @@ class BaseWorker:
                             daemon=True
                         )
                         thread.start()
-                        print(f"🚀 Started processing job {job_id[:8]}... (active: {len(self.active_jobs)}/{max_concurrent})")
+                        logger.info("🚀 Started processing job %s... (active: %s/%s)", job_id[:8], len(self.active_jobs), max_concurrent)
                 
                 # Wait before next poll
                 time.sleep(WORKER_POLL_INTERVAL)
                 
         except KeyboardInterrupt:
-            print(f"\n\n🛑 {self.worker_name} stopped by user")
+            logger.info("🛑 %s stopped by user", self.worker_name)
             # Wait for active jobs to complete
             with self.active_jobs_lock:
                 if self.active_jobs:
-                    print(f"⏳ Waiting for {len(self.active_jobs)} active job(s) to complete...")
+                    logger.info("⏳ Waiting for %s active job(s) to complete...", len(self.active_jobs))
                     while self.active_jobs:
                         time.sleep(1)
         except Exception as e:
-            print(f"\n❌ {self.worker_name} error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ %s error: %s", self.worker_name, e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
 
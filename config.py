@@ -29,6 +29,8 @@ AI_PROVIDER = os.getenv("AI_PROVIDER", "openai")  # "openai" or "claude"
 YOUTUBE_CLIENT_ID = os.getenv("YOUTUBE_CLIENT_ID", "")
 YOUTUBE_CLIENT_SECRET = os.getenv("YOUTUBE_CLIENT_SECRET", "")
 YOUTUBE_REFRESH_TOKEN = os.getenv("YOUTUBE_REFRESH_TOKEN", "")  # OAuth refresh token
+# Videos smaller than this (MiB) are uploaded in one request instead of a resumable session
+YOUTUBE_RESUMABLE_THRESHOLD_MB = int(os.getenv("YOUTUBE_RESUMABLE_THRESHOLD_MB", "100"))
 
 # Video Processing Configuration
 VIDEO_FOLDER = Path(os.getenv("VIDEO_FOLDER", "/Users/phill/Desktop/instagram_downloads"))
@@ -36,24 +38,43 @@ WHISPER_MODEL = os.getenv("WHISPER_MODEL", "tiny")  # Changed to "tiny" for 3-4x
 # Handle empty string as None for auto-select
 _edge_tts_voice = os.getenv("EDGE_TTS_VOICE", None)
 EDGE_TTS_VOICE = None if _edge_tts_voice == "" or _edge_tts_voice is None else _edge_tts_voice
+# Number of voiceover sentences synthesized concurrently (shared by all jobs in a worker)
+TTS_MAX_PARALLEL = int(os.getenv("TTS_MAX_PARALLEL", "8"))
 
 # Worker Configuration
 WORKER_POLL_INTERVAL = int(os.getenv("WORKER_POLL_INTERVAL", "10"))  # seconds
 # Allow multiple jobs to be processed in parallel (set to 1 for sequential, higher for parallel)
 WORKER_MAX_CONCURRENT_JOBS = int(os.getenv("WORKER_MAX_CONCURRENT_JOBS", "3"))
+# Voiceover jobs are network-bound (edge-tts), so the voiceover worker can run more of them at once
+VOICEOVER_MAX_CONCURRENT_JOBS = int(os.getenv("VOICEOVER_MAX_CONCURRENT_JOBS", "8"))
+# Worker log level - set to DEBUG to also log full tracebacks for failed jobs
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# Video Worker Configuration
+# Retry a render once if it fails (ffmpeg broken pipes are rare now that rendering streams straight to ffmpeg)
+RETRY_ON_BROKEN_PIPE = os.getenv("RETRY_ON_BROKEN_PIPE", "false").lower() == "true"
+# For "run_all" jobs, queue the YouTube upload automatically after the video is rendered
+AUTO_POST_AFTER_VIDEO = os.getenv("AUTO_POST_AFTER_VIDEO", "false").lower() == "true"
 
 # File Paths
 LOCAL_TEMP_DIR = Path(os.getenv("LOCAL_TEMP_DIR", "/tmp/youtube_automation"))
+# Per-job scratch directories for workers (tmpfs by default; falls back to the system temp dir)
+WORKER_TEMP_DIR = os.getenv("WORKER_TEMP_DIR", "/dev/shm")
 
 # Local file storage paths (instead of Supabase Storage)
 LOCAL_VIDEOS_DIR = Path(os.getenv("LOCAL_VIDEOS_DIR", "/Users/phill/Desktop/youtube_automation/videos"))
 LOCAL_VOICEOVERS_DIR = Path(os.getenv("LOCAL_VOICEOVERS_DIR", "/Users/phill/Desktop/youtube_automation/voiceovers"))
 THUMBNAILS_DIR = Path(os.getenv("THUMBNAILS_DIR", "/Users/phill/Desktop/youtube_automation/thumbnails"))
+# Cache of synthesized TTS audio, keyed by sha256(voice|text)
+TTS_CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR", "/Users/phill/Desktop/youtube_automation/tts_cache"))
+# Size cap for TTS_CACHE_DIR; the least recently used entries are pruned at worker start
+TTS_CACHE_MAX_MB = int(os.getenv("TTS_CACHE_MAX_MB", "2048"))
 
 # Create directories if they don't exist
 LOCAL_VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
 LOCAL_VOICEOVERS_DIR.mkdir(parents=True, exist_ok=True)
 THUMBNAILS_DIR.mkdir(parents=True, exist_ok=True)
+TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 def validate_config():
     """Validate that required configuration is present"""
@@ -5,13 +5,30 @@ Handles all Supabase database and storage operations
 
 from typing import Optional, List, Dict, Any
 from pathlib import Path
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, ClientOptions
+from postgrest.types import ReturnMethod
 from config import SUPABASE_URL, SUPABASE_SERVICE_KEY, STORAGE_BUCKET_VOICEOVERS, STORAGE_BUCKET_RENDERS, STORAGE_BUCKET_SCRIPTS, LOCAL_VIDEOS_DIR, LOCAL_VOICEOVERS_DIR
+import os
+import errno
 import uuid
+import base64
 import shutil
 from datetime import datetime
 
 
+# Shared HTTP/2 keep-alive pool for every SupabaseClient in this process
+# Status updates reuse warm TLS connections instead of reconnecting per call
+_HTTP_CLIENT = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=8),
+    timeout=30.0
+)
+
+# Supabase Storage resumable (TUS) uploads require exactly 6 MiB chunks
+RESUMABLE_CHUNK_SIZE = 6 * 1024 * 1024
+
+
 class SupabaseClient:
     """Client for interacting with Supabase database and storage"""
     
@@ -19,7 +36,12 @@ class SupabaseClient:
         if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
             raise ValueError("Supabase URL and Service Key must be set in config")
         
-        self.client: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+        self._http = _HTTP_CLIENT
+        self.client: Client = create_client(
+            SUPABASE_URL,
+            SUPABASE_SERVICE_KEY,
+            options=ClientOptions(httpx_client=self._http)
+        )
     
     # ========== Job Management ==========
     
@@ -34,19 +56,31 @@ class SupabaseClient:
         result = self.client.table("video_jobs").insert(job_data).execute()
         return result.data[0] if result.data else None
     
-    def get_pending_jobs(self, limit: int = 1) -> List[Dict[str, Any]]:
-        """Get pending jobs (for worker to process) - includes 'pending' and 'ready' status"""
-        result = self.client.table("video_jobs")\
+    def get_pending_jobs(self, limit: int = 1, action_needed: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get pending jobs (for worker to process) - includes 'pending' and 'ready' status
+        
+        If action_needed is given, only jobs whose metadata.action_needed matches are returned
+        (served by the idx_video_jobs_action_pending partial index)
+        """
+        query = self.client.table("video_jobs")\
             .select("*")\
-            .in_("status", ["pending", "ready"])\
-            .order("created_at", desc=False)\
-            .limit(limit)\
-            .execute()
+            .in_("status", ["pending", "ready"])
+        
+        if action_needed:
+            query = query.eq("metadata->>action_needed", action_needed)
+        
+        result = query.order("created_at", desc=False).limit(limit).execute()
         
         return result.data if result.data else []
     
-    def update_job_status(self, job_id: str, status: Optional[str] = None, error_message: Optional[str] = None, **updates) -> bool:
-        """Update job status and other fields"""
+    def update_job_status(self, job_id: str, status: Optional[str] = None, error_message: Optional[str] = None, **updates) -> Optional[Dict[str, Any]]:
+        """
+        Update job status and other fields
+        
+        Returns:
+            The updated job row (PostgREST returns it with the update), or None if no job matched
+        """
         update_data = {
             "updated_at": datetime.utcnow().isoformat()
         }
@@ -72,11 +106,39 @@ class SupabaseClient:
         update_data.update(updates)
         
         result = self.client.table("video_jobs")\
-            .update(update_data)\
+            .update(update_data, returning=ReturnMethod.representation)\
             .eq("id", job_id)\
             .execute()
         
-        return len(result.data) > 0
+        return result.data[0] if result.data else None
+    
+    def update_voiceover_progress(self, job_id: str, sub_status: Optional[str] = None,
+                                  new_status: Optional[str] = None,
+                                  action_transition: Optional[str] = None,
+                                  script_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Update job status/sub_status in a single round trip (update_voiceover_progress RPC)
+        
+        Args:
+            job_id: Job to update
+            sub_status: New metadata.sub_status (None = unchanged)
+            new_status: New job status (None = unchanged)
+            action_transition: Next action for run_all jobs; other jobs get action_needed cleared
+                               (None = leave action_needed untouched)
+            script_hash: New metadata.voiceover_script_hash (None = unchanged)
+        
+        Returns:
+            The updated job row, or None if the job doesn't exist
+        """
+        result = self.client.rpc("update_voiceover_progress", {
+            "p_job_id": job_id,
+            "p_sub_status": sub_status,
+            "p_new_status": new_status,
+            "p_action_transition": action_transition,
+            "p_script_hash": script_hash
+        }).execute()
+        
+        return result.data or None
     
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get a single job by ID"""
@@ -108,36 +170,100 @@ class SupabaseClient:
         if not file_name:
             file_name = f"{uuid.uuid4()}{file_path.suffix}"
         
-        # Read file content
-        with open(file_path, "rb") as f:
-            file_content = f.read()
+        content_type = self._get_content_type(file_path.suffix)
+        file_size = file_path.stat().st_size
         
-        # Upload to storage
-        result = self.client.storage.from_(bucket).upload(
-            path=file_name,
-            file=file_content,
-            file_options={"content-type": self._get_content_type(file_path.suffix)}
-        )
+        if file_size > RESUMABLE_CHUNK_SIZE:
+            # Large files: chunked resumable upload (only one chunk in memory at a time)
+            self._upload_file_resumable(file_path, bucket, file_name, content_type, file_size)
+        else:
+            # Read file content
+            with open(file_path, "rb") as f:
+                file_content = f.read()
+            
+            # Upload to storage
+            result = self.client.storage.from_(bucket).upload(
+                path=file_name,
+                file=file_content,
+                file_options={"content-type": content_type}
+            )
         
         # Get public URL
         url_result = self.client.storage.from_(bucket).get_public_url(file_name)
         return url_result
     
-    def save_voiceover_path(self, file_path: Path, job_id: str) -> str:
-        """Save voiceover file locally with unique name and return the local path"""
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+    def _upload_file_resumable(self, file_path: Path, bucket: str, file_name: str, content_type: str, file_size: int):
+        """Upload a file to Supabase Storage with the TUS resumable protocol in 6 MiB chunks"""
+        def _b64(value: str) -> str:
+            return base64.b64encode(value.encode("utf-8")).decode("ascii")
         
-        # Generate unique filename: job_id_timestamp_uuid.mp3
+        headers = {
+            "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
+            "apikey": SUPABASE_SERVICE_KEY,
+            "Tus-Resumable": "1.0.0"
+        }
+        
+        # Create the upload session
+        response = self._http.post(
+            f"{SUPABASE_URL}/storage/v1/upload/resumable",
+            headers={
+                **headers,
+                "Upload-Length": str(file_size),
+                "Upload-Metadata": ",".join([
+                    f"bucketName {_b64(bucket)}",
+                    f"objectName {_b64(file_name)}",
+                    f"contentType {_b64(content_type)}"
+                ])
+            }
+        )
+        response.raise_for_status()
+        upload_url = response.headers["Location"]
+        
+        # Send the file chunk by chunk
+        offset = 0
+        with open(file_path, "rb") as f:
+            while offset < file_size:
+                chunk = f.read(RESUMABLE_CHUNK_SIZE)
+                response = self._http.patch(
+                    upload_url,
+                    headers={
+                        **headers,
+                        "Upload-Offset": str(offset),
+                        "Content-Type": "application/offset+octet-stream"
+                    },
+                    content=chunk
+                )
+                response.raise_for_status()
+                offset = int(response.headers.get("Upload-Offset", offset + len(chunk)))
+                f.seek(offset)
+    
+    def new_voiceover_path(self, job_id: str) -> Path:
+        """Unique local path for a job's voiceover (job_id_timestamp_uuid.mp3)"""
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         unique_id = str(uuid.uuid4())[:8]
-        filename = f"{job_id}_{timestamp}_{unique_id}.mp3"
+        return LOCAL_VOICEOVERS_DIR / f"{job_id}_{timestamp}_{unique_id}.mp3"
+    
+    def save_voiceover_path(self, file_path: Path, job_id: str) -> str:
+        """
+        Save voiceover file locally with unique name and return the local path
         
-        # Save to local storage directory
-        local_path = LOCAL_VOICEOVERS_DIR / filename
+        Files already in LOCAL_VOICEOVERS_DIR (see new_voiceover_path) are recorded as-is;
+        anything else is moved there (a rename, or copy + delete across filesystems)
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
         
-        # Copy file to local storage
-        shutil.copy2(file_path, local_path)
+        if file_path.parent.resolve() == LOCAL_VOICEOVERS_DIR.resolve():
+            local_path = file_path
+        else:
+            local_path = self.new_voiceover_path(job_id)
+            try:
+                os.replace(file_path, local_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copy2(file_path, local_path)
+                os.unlink(file_path)
         
         # Store absolute path in database
         absolute_path = str(local_path.absolute())
@@ -145,9 +271,13 @@ class SupabaseClient:
         
         return absolute_path
     
-    def save_video_path(self, file_path: Path, job_id: str) -> str:
-        """Save video file locally with unique name and return the local path"""
-        if not file_path.exists():
+    def save_video_path(self, file_path: Path, job_id: str, file_size: Optional[int] = None) -> str:
+        """
+        Save video file locally with unique name and return the local path
+        
+        Pass file_size when the caller has already stat'ed the file to skip the existence check
+        """
+        if file_size is None and not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
         # Generate unique filename: job_id_timestamp_uuid.mp4
@@ -212,9 +342,9 @@ class SupabaseClient:
         result = self.client.table("youtube_videos").insert(video_data).execute()
         return result.data[0] if result.data else None
     
-    def update_job_with_youtube(self, job_id: str, youtube_video_id: str, youtube_url: str):
-        """Update job with YouTube video information"""
-        self.update_job_status(
+    def update_job_with_youtube(self, job_id: str, youtube_video_id: str, youtube_url: str) -> Optional[Dict[str, Any]]:
+        """Update job with YouTube video information and return the updated job"""
+        return self.update_job_status(
             job_id,
             status="completed",
             youtube_video_id=youtube_video_id,
@@ -27,6 +27,12 @@ CREATE TABLE IF NOT EXISTS video_jobs (
 CREATE INDEX IF NOT EXISTS idx_video_jobs_status ON video_jobs(status);
 CREATE INDEX IF NOT EXISTS idx_video_jobs_created_at ON video_jobs(created_at DESC);
 
+-- Partial index for worker polling (pending/ready jobs filtered by metadata->>'action_needed')
+-- On a live database run it outside a transaction with CREATE INDEX CONCURRENTLY to avoid locking writes
+CREATE INDEX IF NOT EXISTS idx_video_jobs_action_pending
+    ON video_jobs ((metadata->>'action_needed'), created_at)
+    WHERE status IN ('pending', 'ready');
+
 -- Function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -66,6 +72,64 @@ CREATE TRIGGER update_youtube_videos_updated_at
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();
 
+-- Atomically update a voiceover job's status/sub_status and advance the run_all flow
+-- Replaces the get_job -> modify metadata -> update round trips (and their read-modify-write races)
+-- p_action_transition: next action for run_all jobs (other jobs get action_needed cleared)
+DROP FUNCTION IF EXISTS update_voiceover_progress(UUID, TEXT, TEXT, TEXT);
+CREATE OR REPLACE FUNCTION update_voiceover_progress(
+    p_job_id UUID,
+    p_sub_status TEXT DEFAULT NULL,
+    p_new_status TEXT DEFAULT NULL,
+    p_action_transition TEXT DEFAULT NULL,
+    p_script_hash TEXT DEFAULT NULL
+)
+RETURNS video_jobs AS $$
+DECLARE
+    job video_jobs;
+    meta JSONB;
+BEGIN
+    SELECT * INTO job FROM video_jobs WHERE id = p_job_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+    
+    meta := COALESCE(job.metadata, '{}'::jsonb);
+    
+    IF p_sub_status IS NOT NULL THEN
+        meta := meta || jsonb_build_object('sub_status', p_sub_status);
+    END IF;
+    
+    IF p_script_hash IS NOT NULL THEN
+        meta := meta || jsonb_build_object('voiceover_script_hash', p_script_hash);
+    END IF;
+    
+    IF p_action_transition IS NOT NULL THEN
+        IF meta->>'original_action' = 'run_all' OR meta->>'action_needed' = 'run_all' THEN
+            meta := meta || jsonb_build_object('action_needed', p_action_transition, 'original_action', 'run_all');
+        ELSE
+            meta := meta - 'action_needed' - 'original_action';
+        END IF;
+        meta := meta - 'missing_dependencies';
+    END IF;
+    
+    UPDATE video_jobs SET
+        metadata = meta,
+        status = COALESCE(p_new_status, status),
+        started_at = CASE
+            WHEN p_new_status IS NOT NULL AND p_new_status <> 'pending' THEN COALESCE(started_at, NOW())
+            ELSE started_at
+        END,
+        completed_at = CASE
+            WHEN p_new_status IN ('completed', 'failed') THEN NOW()
+            ELSE completed_at
+        END
+    WHERE id = p_job_id
+    RETURNING * INTO job;
+    
+    RETURN job;
+END;
+$$ LANGUAGE plpgsql;
+
 -- Enable Row Level Security (RLS)
 ALTER TABLE video_jobs ENABLE ROW LEVEL SECURITY;
 ALTER TABLE youtube_videos ENABLE ROW LEVEL SECURITY;
@@ -5,7 +5,7 @@ Wraps the existing youtube_video_generator.py as a module for use in the worker
 
 import sys
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional, Union, BinaryIO
 import tempfile
 import shutil
 
@@ -19,14 +19,20 @@ from youtube_video_generator import (
     generate_word_timestamps,
     create_ass_subtitles,
     render_final_video,
-    check_dependencies
+    concat_audio_files,
+    synthesize_speech,
+    resolve_voice,
+    check_dependencies,
+    _ffmpeg_threads,
+    _probe_duration
 )
 
 
 class VideoProcessor:
     """Process videos using the existing youtube_video_generator functions"""
     
-    def __init__(self, video_folder: Path, whisper_model: str = "base", voice: Optional[str] = None):
+    def __init__(self, video_folder: Path, whisper_model: str = "base", voice: Optional[str] = None,
+                 concurrent_jobs: int = 1):
         """
         Initialize video processor
         
@@ -34,6 +40,8 @@ class VideoProcessor:
             video_folder: Path to folder containing background videos
             whisper_model: Whisper model to use (tiny, base, small, medium, large)
             voice: Edge-TTS voice to use (None = auto-select)
+            concurrent_jobs: Videos rendered at once in this process; CPU cores are split
+                between their ffmpeg invocations
         """
         if not check_dependencies():
             raise RuntimeError("Required dependencies not installed")
@@ -41,6 +49,7 @@ class VideoProcessor:
         self.video_folder = video_folder
         self.whisper_model = whisper_model
         self.voice = voice
+        self.ffmpeg_threads = _ffmpeg_threads(concurrent_jobs)
         self.temp_dir = None
         self.voiceover_path = None
     
@@ -61,7 +70,7 @@ class VideoProcessor:
         
         try:
             # Generate voiceover
-            success, duration = generate_voiceover(script_text, output_path, self.voice)
+            success, duration, _ = generate_voiceover(script_text, output_path, self.voice)
             if not success:
                 return False, None
             
@@ -77,6 +86,36 @@ class VideoProcessor:
             return False, None
         # Note: Don't cleanup temp_dir here - let the caller handle it
     
+    def resolved_voice(self) -> str:
+        """The edge-tts voice voiceovers are generated with (resolves auto-selection once)"""
+        return resolve_voice(self.voice)
+    
+    def synthesize_voiceover_part(self, text: str, output: Union[Path, BinaryIO]) -> bool:
+        """
+        Synthesize one chunk of a voiceover (thread-safe, no duration probe)
+        
+        Args:
+            text: Text of this chunk
+            output: Where to save the MP3 - a file path, or a binary file object to stream into
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        return synthesize_speech(text, output, self.voice)
+    
+    def concat_voiceover_parts(self, part_paths: List[Path], output_path: Path) -> bool:
+        """
+        Join voiceover MP3 parts into a single file (stream copy, no re-encode)
+        
+        Args:
+            part_paths: Voiceover parts in playback order
+            output_path: Where to save the combined MP3 file
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        return concat_audio_files(part_paths, output_path)
+    
     def process_video(self, script_text: str, output_path: Path, voiceover_path: Optional[Path] = None) -> Tuple[bool, Optional[float]]:
         """
         Process a complete video from script text (OPTIMIZED with parallelization)
@@ -97,21 +136,20 @@ class VideoProcessor:
         
         try:
             # Step 1: Use existing voiceover or generate new one
+            # Word timings reported by edge-tts while generating; existing files need Whisper
+            tts_word_timestamps = []
             if voiceover_path and voiceover_path.exists():
                 # Use existing voiceover file
                 import shutil
                 audio_path = self.temp_dir / "voiceover.mp3"
                 shutil.copy2(voiceover_path, audio_path)
                 # Get duration from existing file
-                import moviepy.editor as mp
-                audio_clip = mp.AudioFileClip(str(audio_path))
-                duration = audio_clip.duration
-                audio_clip.close()
+                duration = _probe_duration(audio_path)
                 self.voiceover_path = audio_path
             else:
                 # Generate voiceover
                 audio_path = self.temp_dir / "voiceover.mp3"
-                success, duration = generate_voiceover(script_text, audio_path, self.voice)
+                success, duration, tts_word_timestamps = generate_voiceover(script_text, audio_path, self.voice)
                 if not success:
                     return False, None
                 
@@ -121,7 +159,7 @@ class VideoProcessor:
             print(f"  ⚡ Starting parallel processing (background video + timestamps)...")
             
             # Steps 2 & 3: Run in parallel (both only need audio_path and duration)
-            video_clip = None
+            background = None
             word_timestamps = None
             errors = []
             
@@ -136,7 +174,9 @@ class VideoProcessor:
                     return None
             
             def extract_timestamps():
-                """Extract word timestamps"""
+                """Extract word timestamps (edge-tts timings when available, otherwise Whisper)"""
+                if tts_word_timestamps:
+                    return tts_word_timestamps
                 try:
                     return generate_word_timestamps(audio_path, self.whisper_model)
                 except Exception as e:
@@ -159,7 +199,7 @@ class VideoProcessor:
                 future_timestamps = executor.submit(extract_timestamps)
                 
                 # Wait for both to complete
-                video_clip = future_video.result()
+                background = future_video.result()
                 word_timestamps = future_timestamps.result()
             
             # Check for errors
@@ -169,7 +209,7 @@ class VideoProcessor:
                     print(f"     - {error}")
                 return False, None
             
-            if video_clip is None:
+            if background is None:
                 print(f"  ❌ Background video compilation failed")
                 return False, None
             
@@ -185,7 +225,8 @@ class VideoProcessor:
                 return False, None
             
             # Step 5: Render final video (optimized single-pass)
-            if not render_final_video(video_clip, audio_path, subtitle_path, output_path):
+            if not render_final_video(background, audio_path, subtitle_path, output_path,
+                                      threads=self.ffmpeg_threads):
                 return False, None
             
             return True, duration
@@ -199,10 +240,7 @@ class VideoProcessor:
         finally:
             # Cleanup temp directory
             if self.temp_dir and self.temp_dir.exists():
-                try:
-                    shutil.rmtree(self.temp_dir)
-                except:
-                    pass
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def get_voiceover_path(self) -> Optional[Path]:
         """Get the path to the generated voiceover file (if available)"""
@@ -213,8 +251,5 @@ class VideoProcessor:
     def cleanup(self):
         """Manually cleanup temp files"""
         if self.temp_dir and self.temp_dir.exists():
-            try:
-                shutil.rmtree(self.temp_dir)
-            except:
-                pass
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
 
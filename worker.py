@@ -6,6 +6,7 @@ Polls Supabase for pending jobs and processes them locally
 
 import time
 import sys
+import shutil
 from pathlib import Path
 from typing import Optional
 from config import (
@@ -128,11 +129,7 @@ class Worker:
                 
                 # Cleanup
                 print(f"\n[3/3] Cleaning up...")
-                try:
-                    import shutil
-                    shutil.rmtree(temp_dir)
-                except:
-                    pass
+                shutil.rmtree(temp_dir, ignore_errors=True)
                 
                 print(f"\n✅ Job completed successfully!")
                 print(f"   YouTube: {youtube_url}")
@@ -191,11 +188,7 @@ class Worker:
                 print(f"  ✅ Posted to YouTube and saved: {youtube_url}")
                 
                 # Cleanup
-                try:
-                    import shutil
-                    shutil.rmtree(temp_dir)
-                except:
-                    pass
+                shutil.rmtree(temp_dir, ignore_errors=True)
                 
                 print(f"\n✅ Job completed successfully!")
                 print(f"   YouTube: {youtube_url}")
@@ -312,7 +305,7 @@ class Worker:
                 
                 if voiceover_url:
                     # Check if voiceover_url is a local path or URL
-                    if voiceover_url.startswith('http://') or voiceover_url.startswith('https://'):
+                    if voiceover_url.startswith(('http://', 'https://')):
                         # Download from Supabase (backward compatibility for old jobs)
                         import requests
                         voiceover_path = temp_dir / "voiceover.mp3"
@@ -405,11 +398,7 @@ class Worker:
             
             # Step 5: Cleanup
             print(f"\n[5/5] Cleaning up...")
-            try:
-                import shutil
-                shutil.rmtree(temp_dir)
-            except:
-                pass
+            shutil.rmtree(temp_dir, ignore_errors=True)
             
             print(f"\n✅ Job completed successfully!")
             print(f"   YouTube: {youtube_url}")
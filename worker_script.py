@@ -5,19 +5,23 @@ Only handles script, title, description, and tags generation
 Dependencies: topic (always available)
 """
 
+import logging
 import sys
 from typing import List, Dict, Any, Tuple
 from base_worker import BaseWorker
 from script_generator import ScriptGenerator
 
 
+logger = logging.getLogger(__name__)
+
+
 class ScriptWorker(BaseWorker):
     """Worker that generates scripts, titles, descriptions, and tags"""
     
     def __init__(self):
         super().__init__("Script Worker")
         self.script_generator = ScriptGenerator()
-        print("✅ Script Worker initialized")
+        logger.info("✅ Script Worker initialized")
     
     def check_dependencies(self, job: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -44,7 +48,7 @@ class ScriptWorker(BaseWorker):
         # Double-check job hasn't been processed already (race condition protection)
         current_job = self.supabase.get_job(job_id)
         if current_job and current_job.get("script"):
-            print(f"  ⚠️  Job {job_id[:8]} already has a script. Skipping to prevent overwrite.")
+            logger.warning("  ⚠️  Job %s already has a script. Skipping to prevent overwrite.", job_id[:8])
             # Still update action_needed if it's run_all
             metadata = current_job.get("metadata", {})
             original_action = metadata.get("original_action", "")
@@ -57,7 +61,7 @@ class ScriptWorker(BaseWorker):
         
         try:
             # Step 1: Generate title and description first (separate API call)
-            print(f"\n[1/3] Generating title and description...")
+            logger.info("[1/3] Generating title and description...")
             # Status already set to generating_script by base_worker when claiming job
             current_job = self.supabase.get_job(job_id)
             current_metadata = current_job.get("metadata", {}) if current_job else {}
@@ -68,18 +72,18 @@ class ScriptWorker(BaseWorker):
             
             # Save title immediately
             self.supabase.update_job_status(job_id, status=None, title=title)
-            print(f"  ✅ Title generated and saved: {title}")
+            logger.info("  ✅ Title generated and saved: %s", title)
             
             # Save description immediately
             self.supabase.update_job_status(job_id, status=None, description=description)
-            print(f"  ✅ Description generated and saved")
+            logger.info("  ✅ Description generated and saved")
             
             # Save tags immediately
             self.supabase.update_job_status(job_id, status=None, tags=tags)
-            print(f"  ✅ Tags generated and saved: {len(tags)} tags")
+            logger.info("  ✅ Tags generated and saved: %s tags", len(tags))
             
             # Step 2: Generate script using title as context (separate API call)
-            print(f"\n[2/3] Generating script (using title as context)...")
+            logger.info("[2/3] Generating script (using title as context)...")
             current_metadata["sub_status"] = "generating_script"
             self.supabase.update_job_status(job_id, status=None, metadata=current_metadata)
             
@@ -87,7 +91,7 @@ class ScriptWorker(BaseWorker):
             
             # Save script immediately
             self.supabase.update_job_status(job_id, status=None, script=script)
-            print(f"  ✅ Script generated and saved ({len(script)} chars)")
+            logger.info("  ✅ Script generated and saved (%s chars)", len(script))
             
             # Clear sub_status
             current_metadata.pop("sub_status", None)
@@ -110,14 +114,13 @@ class ScriptWorker(BaseWorker):
             current_metadata.pop("missing_dependencies", None)
             self.supabase.update_job_status(job_id, "pending", metadata=current_metadata)
             
-            print(f"\n[3/3] ✅ Script generation complete - ready for voiceover")
+            logger.info("[3/3] ✅ Script generation complete - ready for voiceover")
             return True
             
         except Exception as e:
             error_msg = str(e)
-            print(f"\n❌ Script generation failed: {error_msg}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ Script generation failed: %s", error_msg,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             
             self.supabase.update_job_status(
                 job_id,
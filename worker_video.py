@@ -5,16 +5,23 @@ Only handles video rendering
 Dependencies: script, voiceover_url
 """
 
+import logging
+import os
 import sys
-import shutil
 import time
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 from base_worker import BaseWorker
-from config import VIDEO_FOLDER, WHISPER_MODEL, EDGE_TTS_VOICE
+from config import (
+    VIDEO_FOLDER, WHISPER_MODEL, EDGE_TTS_VOICE, RETRY_ON_BROKEN_PIPE, AUTO_POST_AFTER_VIDEO,
+    WORKER_MAX_CONCURRENT_JOBS
+)
 from video_processor import VideoProcessor
 
 
+logger = logging.getLogger(__name__)
+
+
 class VideoWorker(BaseWorker):
     """Worker that renders videos from scripts and voiceovers"""
     
@@ -23,9 +30,10 @@ class VideoWorker(BaseWorker):
         self.video_processor = VideoProcessor(
             video_folder=VIDEO_FOLDER,
             whisper_model=WHISPER_MODEL,
-            voice=EDGE_TTS_VOICE
+            voice=EDGE_TTS_VOICE,
+            concurrent_jobs=WORKER_MAX_CONCURRENT_JOBS
         )
-        print("✅ Video Worker initialized")
+        logger.info("✅ Video Worker initialized")
     
     def check_dependencies(self, job: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -47,116 +55,115 @@ class VideoWorker(BaseWorker):
     
     def process_job(self, job: Dict[str, Any]) -> bool:
         """Process video rendering job"""
+        with self.job_temp_dir(job["id"]) as temp_dir:
+            return self._render_job(job, Path(temp_dir))
+    
+    def _render_job(self, job: Dict[str, Any], temp_dir: Path) -> bool:
+        """Render the job's video inside temp_dir (removed by process_job afterwards)"""
         job_id = job["id"]
         script = job.get("script")
         voiceover_url = job.get("voiceover_url")
         
         if not script:
-            print(f"❌ Script not found for job {job_id}")
+            logger.error("❌ Script not found for job %s", job_id)
             return False
         
         if not voiceover_url:
-            print(f"❌ Voiceover path not found for job {job_id}")
+            logger.error("❌ Voiceover path not found for job %s", job_id)
             return False
         
         # Check if voiceover_url is a local path or URL
-        if voiceover_url.startswith('http://') or voiceover_url.startswith('https://'):
+        if voiceover_url.startswith(('http://', 'https://')):
             # Download from Supabase (backward compatibility for old jobs)
-            print(f"  📥 Downloading voiceover from URL (backward compatibility)...")
-            import requests
-            temp_dir = Path(f"/tmp/youtube_automation_{job_id}")
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            voiceover_path = temp_dir / "voiceover.mp3"
+            logger.info("  📥 Downloading voiceover from URL (backward compatibility)...")
+            voiceover_path = self.download_file(voiceover_url, temp_dir / "voiceover.mp3")
             
-            response = requests.get(voiceover_url, stream=True)
-            response.raise_for_status()
-            
-            with open(voiceover_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            print(f"  ✅ Voiceover downloaded from URL")
+            logger.info("  ✅ Voiceover downloaded from URL")
         else:
             # Use local file path
             voiceover_path = Path(voiceover_url)
             if not voiceover_path.exists():
-                print(f"❌ Voiceover file not found at: {voiceover_url}")
+                logger.error("❌ Voiceover file not found at: %s", voiceover_url)
                 return False
-            print(f"  ✅ Using local voiceover: {voiceover_path}")
+            logger.info("  ✅ Using local voiceover: %s", voiceover_path)
         
         try:
-            print(f"\n[1/3] Rendering video...")
+            logger.info("[1/3] Rendering video...")
             current_job = self.supabase.get_job(job_id)
             current_metadata = current_job.get("metadata", {}) if current_job else {}
             current_metadata["sub_status"] = "rendering_video"
             self.supabase.update_job_status(job_id, "rendering_video", metadata=current_metadata)
             
-            # Create temp directory for this job (use unique name to avoid conflicts)
-            import uuid
-            unique_id = str(uuid.uuid4())[:8]
-            temp_dir = Path(f"/tmp/youtube_automation_{job_id}_{unique_id}")
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            
             video_path = temp_dir / "video.mp4"
             
-            # Process video using existing voiceover file (single attempt, no retries)
-            success, duration = self.video_processor.process_video(script, video_path, voiceover_path=voiceover_path)
+            # Process video using existing voiceover file
+            # A broken ffmpeg pipe surfaces as a failed render, so optionally retry once
+            attempts = 2 if RETRY_ON_BROKEN_PIPE else 1
+            for attempt in range(attempts):
+                success, duration = self.video_processor.process_video(script, video_path, voiceover_path=voiceover_path)
+                if success:
+                    break
+                if attempt + 1 < attempts:
+                    logger.warning("  🔁 Render failed, retrying (%s/%s)...", attempt + 2, attempts)
             
             if not success:
                 raise Exception("Video processing failed")
             
-            if not video_path.exists():
+            # Single stat covers both the existence and the empty-file check
+            try:
+                video_stat = os.stat(video_path)
+            except FileNotFoundError:
                 raise Exception("Video file not found after processing")
+            if video_stat.st_size == 0:
+                raise Exception("Video file is empty after processing")
             
             # Update sub-status to saving
-            print(f"\n[2/3] Saving video locally...")
+            logger.info("[2/3] Saving video locally...")
             current_metadata["sub_status"] = "saving_video"
-            self.supabase.update_job_status(job_id, status=None, metadata=current_metadata)
+            current_job = self.supabase.update_job_status(job_id, status=None, metadata=current_metadata)
             
             # Save video locally with unique name
-            video_path_local = self.supabase.save_video_path(video_path, job_id)
-            print(f"  ✅ Video saved locally: {video_path_local}")
+            video_path_local = self.supabase.save_video_path(video_path, job_id, file_size=video_stat.st_size)
+            logger.info("  ✅ Video saved locally: %s", video_path_local)
             
             # Clear sub_status
             current_metadata.pop("sub_status", None)
             
             # Video creation is complete - check if all steps are done except YouTube upload
-            current_job = self.supabase.get_job(job_id)
-            current_metadata = current_job.get("metadata", {}) if current_job else {}
+            # (use the row returned by the sub-status update plus the video path just saved)
+            current_job = {**(current_job or {}), "video_url": video_path_local}
+            current_metadata = current_job.get("metadata") or {}
             
             # Clear original_action and missing_dependencies
-            current_metadata.pop("original_action", None)
+            is_run_all = current_metadata.pop("original_action", None) == "run_all"
             current_metadata.pop("missing_dependencies", None)
             
             # Check if all steps are complete except YouTube upload
             # If script, voiceover, and video exist but no YouTube URL, set status to "ready"
-            # Do NOT set action_needed - user must manually click "Post to YouTube" button
+            # By default do NOT set action_needed - user must manually click "Post to YouTube" button
             if (current_job.get("script") and 
                 current_job.get("voiceover_url") and 
                 current_job.get("video_url") and 
                 not current_job.get("youtube_url")):
-                # Clear action_needed - workflow stops after video creation, no automatic YouTube upload
-                current_metadata.pop("action_needed", None)
+                if AUTO_POST_AFTER_VIDEO and is_run_all:
+                    # Continue the run_all flow straight into the YouTube upload
+                    current_metadata["action_needed"] = "post_to_youtube"
+                else:
+                    # Clear action_needed - workflow stops after video creation, no automatic YouTube upload
+                    current_metadata.pop("action_needed", None)
                 self.supabase.update_job_status(job_id, "ready", metadata=current_metadata)
             else:
                 # Clear action_needed - workflow stops after video creation
                 current_metadata.pop("action_needed", None)
                 self.supabase.update_job_status(job_id, "pending", metadata=current_metadata)
             
-            # Cleanup
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
-            
-            print(f"\n✅ Video creation complete - ready for YouTube upload")
+            logger.info("✅ Video creation complete - ready for YouTube upload")
             return True
             
         except Exception as e:
             error_msg = str(e)
-            print(f"\n❌ Video creation failed: {error_msg}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ Video creation failed: %s", error_msg,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             
             self.supabase.update_job_status(
                 job_id,
@@ -5,14 +5,61 @@ Only handles voiceover (MP3) generation
 Dependencies: script
 """
 
+import io
+import logging
+import os
+import re
 import sys
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 from base_worker import BaseWorker
-from config import VIDEO_FOLDER, WHISPER_MODEL, EDGE_TTS_VOICE
+from config import (
+    VIDEO_FOLDER, WHISPER_MODEL, EDGE_TTS_VOICE, TTS_CACHE_DIR, TTS_CACHE_MAX_MB, TTS_MAX_PARALLEL,
+    VOICEOVER_MAX_CONCURRENT_JOBS
+)
 from video_processor import VideoProcessor
 
 
+logger = logging.getLogger(__name__)
+
+
+# Sentence boundaries for chunked TTS (split after ., ! or ?)
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Sentence synthesis pool shared by all concurrent jobs, so edge-tts load stays bounded
+_TTS_POOL = ThreadPoolExecutor(max_workers=max(1, TTS_MAX_PARALLEL), thread_name_prefix="tts")
+
+
+def _prune_tts_cache(max_bytes: int) -> None:
+    """Delete the least recently used TTS cache entries (by mtime) until the cache fits max_bytes"""
+    entries = []
+    with os.scandir(TTS_CACHE_DIR) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(".mp3"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+    
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return
+    
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    logger.info("  🧹 Pruned %s TTS cache entries (cache now %.0f MiB)", removed, total / (1024 * 1024))
+
+
 class VoiceoverWorker(BaseWorker):
     """Worker that generates voiceovers from scripts"""
     
@@ -23,7 +70,8 @@ class VoiceoverWorker(BaseWorker):
             whisper_model=WHISPER_MODEL,
             voice=EDGE_TTS_VOICE
         )
-        print("✅ Voiceover Worker initialized")
+        _prune_tts_cache(TTS_CACHE_MAX_MB * 1024 * 1024)
+        logger.info("✅ Voiceover Worker initialized")
     
     def check_dependencies(self, job: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -39,31 +87,117 @@ class VoiceoverWorker(BaseWorker):
         
         return len(missing) == 0, missing
     
+    def _tts_cache_path(self, text: str) -> Path:
+        """Cache location for the MP3 of this text with the voice it is synthesized in"""
+        # Key on the resolved voice, so a change in the auto-selected voice never serves old audio
+        voice = self.video_processor.resolved_voice()
+        key = hashlib.sha256(f"{voice}|{text}".encode("utf-8")).hexdigest()
+        return TTS_CACHE_DIR / f"{key}.mp3"
+    
+    def _tts_cache_lookup(self, text: str, output_path: Path) -> bool:
+        """
+        Copy the cached MP3 for this text to output_path
+        
+        Returns:
+            True on a cache hit, False otherwise
+        """
+        cached_path = self._tts_cache_path(text)
+        try:
+            # Mark the entry as recently used so pruning keeps it
+            os.utime(cached_path)
+            shutil.copy(cached_path, output_path)
+        except FileNotFoundError:
+            return False
+        return True
+    
+    def _synthesize_cached(self, text: str, output_path: Path) -> bool:
+        """Generate the MP3 for this text into output_path, reusing the TTS cache when possible"""
+        if self._tts_cache_lookup(text, output_path):
+            return True
+        
+        # Stream the audio into memory, then write it out once for the job and once for the cache
+        buffer = io.BytesIO()
+        if not self.video_processor.synthesize_voiceover_part(text, buffer):
+            return False
+        audio = buffer.getvalue()
+        if not audio:
+            return False
+        output_path.write_bytes(audio)
+        
+        # Publish the cache entry atomically
+        cached_path = self._tts_cache_path(text)
+        partial_path = cached_path.with_name(f"{cached_path.stem}.{os.getpid()}_{threading.get_ident()}.part.mp3")
+        try:
+            partial_path.write_bytes(audio)
+            os.replace(partial_path, cached_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+        return True
+    
+    def _generate_voiceover(self, script: str, output_path: Path, work_dir: Path) -> bool:
+        """
+        Generate the voiceover for a script, one sentence per TTS request
+        
+        Sentences are synthesized in parallel (edge-tts is network-bound) and joined with a
+        stream copy. Sentences synthesized before (same text and voice) come from the cache,
+        so edited scripts and retries only pay for the sentences that changed.
+        """
+        sentences = [c.strip() for c in _SENT_SPLIT.split(script) if c.strip()]
+        if len(sentences) <= 1:
+            return self._synthesize_cached(script, output_path)
+        
+        part_paths = [work_dir / f"part_{i:04d}.mp3" for i in range(len(sentences))]
+        logger.info("  🎵 Synthesizing %s sentences (%s in parallel)...", len(sentences), TTS_MAX_PARALLEL)
+        
+        try:
+            results = list(_TTS_POOL.map(self._synthesize_cached, sentences, part_paths))
+            if not all(results):
+                return False
+            return self.video_processor.concat_voiceover_parts(part_paths, output_path)
+        finally:
+            for part_path in part_paths:
+                part_path.unlink(missing_ok=True)
+    
     def process_job(self, job: Dict[str, Any]) -> bool:
         """Process voiceover generation job"""
+        with self.job_temp_dir(job["id"]) as temp_dir:
+            return self._voiceover_job(job, Path(temp_dir))
+    
+    def _voiceover_job(self, job: Dict[str, Any], temp_dir: Path) -> bool:
+        """Generate the job's voiceover, using temp_dir for the sentence parts"""
         job_id = job["id"]
         script = job.get("script")
         
         if not script:
-            print(f"❌ Script not found for job {job_id}")
+            logger.error("❌ Script not found for job %s", job_id)
             return False
         
+        voiceover_path = None
+        # Once saved, the job row points at the voiceover, so it must survive later failures
+        voiceover_saved = False
         try:
-            print(f"\n[1/2] Generating voiceover...")
-            current_job = self.supabase.get_job(job_id)
-            current_metadata = current_job.get("metadata", {}) if current_job else {}
-            current_metadata["sub_status"] = "generating_audio"
-            self.supabase.update_job_status(job_id, "creating_voiceover", metadata=current_metadata)
+            # Re-runs (e.g. a run_all job re-queued after a downstream failure) reuse the saved
+            # voiceover when neither the script nor the voice has changed since it was generated
+            # (same voice|text key shape as the TTS cache)
+            voice = self.video_processor.resolved_voice()
+            script_hash = hashlib.sha256(f"{voice}|{script}".encode("utf-8")).hexdigest()
+            metadata = job.get("metadata") or {}
+            existing_voiceover = job.get("voiceover_url")
+            if (metadata.get("voiceover_script_hash") == script_hash
+                    and existing_voiceover and Path(existing_voiceover).exists()):
+                logger.info("  ✅ Voiceover cache hit, reusing: %s", existing_voiceover)
+                self.supabase.update_voiceover_progress(job_id, new_status="pending", action_transition="create_video")
+                return True
             
-            # Create temp directory for this job
-            temp_dir = Path(f"/tmp/youtube_automation_{job_id}")
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            logger.info("[1/2] Generating voiceover...")
+            self.supabase.update_voiceover_progress(job_id, sub_status="generating_audio", new_status="creating_voiceover")
             
-            # Generate voiceover directly to temp directory
-            voiceover_path = temp_dir / "voiceover.mp3"
+            # Generate voiceover straight into the voiceovers directory so saving it is just
+            # recording the path (the temp directory only holds the sentence parts)
+            voiceover_path = self.supabase.new_voiceover_path(job_id)
             
-            # Generate voiceover only (no video processing)
-            success, duration = self.video_processor.generate_voiceover_only(script, voiceover_path)
+            # Generate voiceover only (no video processing), reusing cached sentences
+            success = self._generate_voiceover(script, voiceover_path, temp_dir)
             
             if not success:
                 raise Exception("Voiceover generation failed")
@@ -72,47 +206,33 @@ class VoiceoverWorker(BaseWorker):
             if not voiceover_path.exists():
                 raise Exception("Voiceover file not found after processing")
             
-            # Update sub-status to saving
-            print(f"\n[2/2] Saving voiceover locally...")
-            current_metadata["sub_status"] = "saving_voiceover"
-            self.supabase.update_job_status(job_id, status=None, metadata=current_metadata)
+            # Save voiceover locally with unique name in the background
+            # while the sub-status is updated
+            logger.info("[2/2] Saving voiceover locally...")
+            save_future = self.submit_io(self.supabase.save_voiceover_path, voiceover_path, job_id)
             
-            # Use the voiceover path directly (no need to copy)
-            worker_voiceover_path = voiceover_path
-            
-            # Save voiceover locally with unique name
-            voiceover_path_local = self.supabase.save_voiceover_path(worker_voiceover_path, job_id)
-            print(f"  ✅ Voiceover saved locally: {voiceover_path_local}")
-            
-            # Update action_needed based on original action
-            current_job = self.supabase.get_job(job_id)
-            current_metadata = current_job.get("metadata", {}) if current_job else {}
-            original_action = current_metadata.get("original_action", "")
-            current_action = current_metadata.get("action_needed", "")
-            
-            # If it was "run_all", preserve it and set next action to "create_video"
-            # This ensures video worker knows to continue the run_all flow
-            if original_action == "run_all" or current_action == "run_all":
-                current_metadata["action_needed"] = "create_video"
-                current_metadata["original_action"] = "run_all"  # Preserve for video worker
-            else:
-                current_metadata.pop("action_needed", None)
-                current_metadata.pop("original_action", None)
+            # Update sub-status to saving
+            self.supabase.update_voiceover_progress(job_id, sub_status="saving_voiceover")
             
-            current_metadata.pop("missing_dependencies", None)
-            self.supabase.update_job_status(job_id, "pending", metadata=current_metadata)
+            # The voiceover must be saved before the job is handed to the next worker
+            voiceover_path_local = save_future.result()
+            voiceover_saved = True
+            logger.info("  ✅ Voiceover saved locally: %s", voiceover_path_local)
             
-            # Cleanup temp files (keep voiceover in temp_dir for video worker if needed)
-            # Actually, let's keep it for now in case video worker needs it
+            # Back to pending; for "run_all" the RPC preserves original_action and sets the
+            # next action to "create_video" so the video worker continues the flow
+            self.supabase.update_voiceover_progress(job_id, new_status="pending", action_transition="create_video",
+                                                    script_hash=script_hash)
             
-            print(f"\n✅ Voiceover generation complete - ready for video creation")
+            logger.info("✅ Voiceover generation complete - ready for video creation")
             return True
             
         except Exception as e:
             error_msg = str(e)
-            print(f"\n❌ Voiceover generation failed: {error_msg}")
-            import traceback
-            traceback.print_exc()
+            if voiceover_path is not None and not voiceover_saved:
+                voiceover_path.unlink(missing_ok=True)
+            logger.error("❌ Voiceover generation failed: %s", error_msg,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             
             self.supabase.update_job_status(
                 job_id,
@@ -125,7 +245,7 @@ class VoiceoverWorker(BaseWorker):
 def main():
     """Main entry point"""
     worker = VoiceoverWorker()
-    worker.run("generate_voiceover")
+    worker.run("generate_voiceover", max_concurrent=VOICEOVER_MAX_CONCURRENT_JOBS)
 
 
 if __name__ == "__main__":
@@ -5,9 +5,11 @@ Only handles YouTube uploads
 Dependencies: title, description, video_url
 """
 
+import logging
+import os
 import sys
-import requests
-import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import random
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
@@ -16,13 +18,25 @@ from youtube_uploader import YouTubeUploader
 from config import THUMBNAILS_DIR
 
 
+logger = logging.getLogger(__name__)
+
+
+# Thumbnail image extensions (WEBP is converted to JPG before upload)
+_IMG_EXTS = frozenset({'.webp', '.jpg', '.jpeg', '.png', '.gif', '.bmp'})
+
+
 class YouTubeWorker(BaseWorker):
     """Worker that uploads videos to YouTube"""
     
     def __init__(self):
         super().__init__("YouTube Worker")
-        self.youtube_uploader = YouTubeUploader()
-        print("✅ YouTube Worker initialized")
+        # Authenticate at startup so an OAuth prompt never happens in the middle of a job
+        self.youtube_uploader = YouTubeUploader.preauth()
+        # (thumbnails dir mtime, thumbnail paths) - see _list_thumbnails
+        self._thumb_list_cache: Optional[Tuple[int, List[Path]]] = None
+        # Runs thumbnail selection/conversion alongside the video download
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        logger.info("✅ YouTube Worker initialized")
     
     def check_dependencies(self, job: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -46,6 +60,69 @@ class YouTubeWorker(BaseWorker):
         
         return len(missing) == 0, missing
     
+    def _list_thumbnails(self) -> List[Path]:
+        """List thumbnail images, cached until the thumbnails directory changes (mtime)"""
+        dir_mtime = THUMBNAILS_DIR.stat().st_mtime_ns
+        cached = self._thumb_list_cache
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+        
+        # Get all image files (webp, jpg, jpeg, png) in one scandir pass
+        # (DirEntry.is_file() uses the cached dirent type - no extra stat per file)
+        with os.scandir(THUMBNAILS_DIR) as entries:
+            thumbnails = [
+                Path(entry.path) for entry in entries
+                if not entry.name.startswith('.')  # Skip hidden files like .DS_Store
+                and os.path.splitext(entry.name)[1].lower() in _IMG_EXTS
+                and entry.is_file()
+            ]
+        self._thumb_list_cache = (dir_mtime, thumbnails)
+        return thumbnails
+    
+    def _convert_webp_to_jpg(self, source: Path) -> Optional[Path]:
+        """
+        Convert a WEBP thumbnail to JPG (YouTube API doesn't accept WEBP)
+        Conversions are kept in THUMBNAILS_DIR/.converted, keyed by source name + mtime
+        
+        Returns:
+            Path to the JPG, or None if conversion failed
+        """
+        converted_dir = THUMBNAILS_DIR / '.converted'
+        converted_path = converted_dir / f"{source.stem}_{source.stat().st_mtime_ns}.jpg"
+        if converted_path.exists():
+            logger.info("  ✅ Using converted JPG: %s", converted_path.name)
+            return converted_path
+        
+        try:
+            from PIL import Image
+            
+            # Convert WEBP to JPG
+            logger.info("  🔄 Converting WEBP to JPG for YouTube compatibility...")
+            img = Image.open(source)
+            # Convert RGBA to RGB if needed (JPG doesn't support transparency)
+            if img.mode in ('RGBA', 'LA', 'P'):
+                # Composite over a white background in a single alpha_composite pass
+                img = img.convert('RGBA')
+                background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+                img = Image.alpha_composite(background, img).convert('RGB')
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
+            
+            # Save as JPG (4:2:0 chroma is plenty for a thumbnail), then publish atomically
+            converted_dir.mkdir(exist_ok=True)
+            partial_path = converted_dir / f".{converted_path.stem}.{os.getpid()}_{threading.get_ident()}.part"
+            img.save(partial_path, 'JPEG', quality=90, optimize=False, subsampling=2)
+            os.replace(partial_path, converted_path)
+            
+            logger.info("  ✅ Converted to JPG: %s", converted_path.name)
+            return converted_path
+        except ImportError:
+            logger.warning("  ⚠️  PIL/Pillow not available, cannot convert WEBP. Skipping thumbnail.")
+            return None
+        except Exception as e:
+            logger.warning("  ⚠️  Failed to convert WEBP to JPG: %s. Skipping thumbnail.", e)
+            return None
+    
     def get_random_thumbnail(self) -> Optional[Path]:
         """
         Get a random thumbnail from the thumbnails folder
@@ -55,66 +132,34 @@ class YouTubeWorker(BaseWorker):
             Path to thumbnail file (converted to JPG if needed), or None if no thumbnails found
         """
         if not THUMBNAILS_DIR.exists():
-            print(f"  ⚠️  Thumbnails directory not found: {THUMBNAILS_DIR}")
+            logger.warning("  ⚠️  Thumbnails directory not found: %s", THUMBNAILS_DIR)
             return None
         
-        # Get all image files (webp, jpg, jpeg, png)
-        image_extensions = {'.webp', '.jpg', '.jpeg', '.png', '.gif', '.bmp'}
-        thumbnails = [
-            f for f in THUMBNAILS_DIR.iterdir()
-            if f.is_file() and f.suffix.lower() in image_extensions
-            and not f.name.startswith('.')  # Skip hidden files like .DS_Store
-        ]
+        thumbnails = self._list_thumbnails()
         
         if not thumbnails:
-            print(f"  ⚠️  No thumbnails found in {THUMBNAILS_DIR}")
+            logger.warning("  ⚠️  No thumbnails found in %s", THUMBNAILS_DIR)
             return None
         
         # Select random thumbnail
         selected = random.choice(thumbnails)
-        print(f"  🖼️  Selected thumbnail: {selected.name}")
+        logger.info("  🖼️  Selected thumbnail: %s", selected.name)
         
         # YouTube API accepts: JPG, PNG, GIF, BMP (not WEBP)
         # Convert WEBP to JPG if needed
         if selected.suffix.lower() == '.webp':
-            try:
-                from PIL import Image
-                import tempfile
-                
-                # Convert WEBP to JPG
-                print(f"  🔄 Converting WEBP to JPG for YouTube compatibility...")
-                img = Image.open(selected)
-                # Convert RGBA to RGB if needed (JPG doesn't support transparency)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Create white background
-                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = rgb_img
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Save as JPG to temp file
-                temp_jpg = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-                temp_jpg_path = Path(temp_jpg.name)
-                img.save(temp_jpg_path, 'JPEG', quality=95)
-                temp_jpg.close()
-                
-                print(f"  ✅ Converted to JPG: {temp_jpg_path.name}")
-                return temp_jpg_path
-            except ImportError:
-                print(f"  ⚠️  PIL/Pillow not available, cannot convert WEBP. Skipping thumbnail.")
-                return None
-            except Exception as e:
-                print(f"  ⚠️  Failed to convert WEBP to JPG: {e}. Skipping thumbnail.")
-                return None
+            return self._convert_webp_to_jpg(selected)
         
         # Return original if already in supported format
         return selected
     
     def process_job(self, job: Dict[str, Any]) -> bool:
         """Process YouTube upload job"""
+        with self.job_temp_dir(job["id"]) as temp_dir:
+            return self._upload_job(job, Path(temp_dir))
+    
+    def _upload_job(self, job: Dict[str, Any], temp_dir: Path) -> bool:
+        """Upload the job's video, downloading it into temp_dir first if it is a URL"""
         job_id = job["id"]
         title = job.get("title")
         description = job.get("description", "")
@@ -124,49 +169,46 @@ class YouTubeWorker(BaseWorker):
         privacy_status = metadata.get("privacy_status", "public")  # Default to public
         
         if not title:
-            print(f"❌ Title not found for job {job_id}")
+            logger.error("❌ Title not found for job %s", job_id)
             return False
         
         # Remove quotation marks from title (both single and double quotes)
         title = title.replace('"', '').replace("'", '').strip()
         
         if not video_url:
-            print(f"❌ Video URL not found for job {job_id}")
+            logger.error("❌ Video URL not found for job %s", job_id)
             return False
         
         try:
-            print(f"\n[1/2] Locating video file...")
+            # Pick (and if needed convert) the thumbnail in the background - it doesn't depend on the video
+            thumbnail_future = self._pool.submit(self.get_random_thumbnail)
+            
+            logger.info("[1/2] Locating video file...")
             self.supabase.update_job_status(job_id, "uploading")
             
-            temp_dir = None
+            download_future = None
             # Check if video_url is a local path or URL
-            if video_url.startswith('http://') or video_url.startswith('https://'):
-                # Download from URL (backward compatibility)
-                print(f"  📥 Downloading video from URL...")
-                temp_dir = Path(f"/tmp/youtube_automation_{job_id}")
-                temp_dir.mkdir(parents=True, exist_ok=True)
+            if video_url.startswith(('http://', 'https://')):
+                # Download from URL (backward compatibility) in the background
+                logger.info("  📥 Downloading video from URL...")
                 video_path = temp_dir / "video.mp4"
-                
-                response = requests.get(video_url, stream=True)
-                response.raise_for_status()
-                
-                with open(video_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                print(f"  ✅ Video downloaded")
+                download_future = self.submit_io(self.download_file, video_url, video_path)
             else:
                 # Use local file path directly
                 video_path = Path(video_url)
                 if not video_path.exists():
                     raise FileNotFoundError(f"Video file not found at local path: {video_path}")
-                print(f"  ✅ Using local video: {video_path}")
+                logger.info("  ✅ Using local video: %s", video_path)
+            
+            if download_future:
+                download_future.result()
+                logger.info("  ✅ Video downloaded")
             
             # Get random thumbnail
-            thumbnail_path = self.get_random_thumbnail()
+            thumbnail_path = thumbnail_future.result()
             
             # Upload to YouTube
-            print(f"\n[2/2] Uploading to YouTube...")
+            logger.info("[2/2] Uploading to YouTube...")
             youtube_result = self.youtube_uploader.upload_video(
                 video_path=video_path,
                 title=title,
@@ -181,54 +223,27 @@ class YouTubeWorker(BaseWorker):
             
             # Save YouTube video info immediately
             self.supabase.save_youtube_video(job_id, youtube_video_id, title, description)
-            self.supabase.update_job_with_youtube(job_id, youtube_video_id, youtube_url)
+            current_job = self.supabase.update_job_with_youtube(job_id, youtube_video_id, youtube_url)
+            
+            logger.info("  ✅ Uploaded to YouTube and saved: %s", youtube_url)
             
-            print(f"  ✅ Uploaded to YouTube and saved: {youtube_url}")
+            # The thumbnail was being set while the job row was updated
+            if youtube_result.get("thumbnail_future"):
+                youtube_result["thumbnail_future"].result()
             
-            # Clear action_needed
-            current_job = self.supabase.get_job(job_id)
+            # Clear action_needed (metadata comes from the row returned by the update above)
             current_metadata = current_job.get("metadata", {}) if current_job else {}
             current_metadata.pop("action_needed", None)
             current_metadata.pop("missing_dependencies", None)
             self.supabase.update_job_status(job_id, "completed", metadata=current_metadata)
             
-            # Cleanup temp files
-            if temp_dir:
-                try:
-                    shutil.rmtree(temp_dir)
-                except:
-                    pass
-            
-            # Cleanup converted thumbnail temp file if it was created (WEBP -> JPG conversion)
-            if thumbnail_path and thumbnail_path.exists() and '/tmp' in str(thumbnail_path) and thumbnail_path.suffix.lower() == '.jpg':
-                try:
-                    thumbnail_path.unlink()
-                    print(f"  🗑️  Cleaned up temporary thumbnail file")
-                except:
-                    pass
-            
-            print(f"\n✅ YouTube upload complete!")
+            logger.info("✅ YouTube upload complete!")
             return True
             
         except Exception as e:
             error_msg = str(e)
-            print(f"\n❌ YouTube upload failed: {error_msg}")
-            import traceback
-            traceback.print_exc()
-            
-            # Cleanup temp files even on error
-            if temp_dir:
-                try:
-                    shutil.rmtree(temp_dir)
-                except:
-                    pass
-            
-            # Cleanup converted thumbnail temp file if it was created
-            if 'thumbnail_path' in locals() and thumbnail_path and thumbnail_path.exists() and '/tmp' in str(thumbnail_path) and thumbnail_path.suffix.lower() == '.jpg':
-                try:
-                    thumbnail_path.unlink()
-                except:
-                    pass
+            logger.error("❌ YouTube upload failed: %s", error_msg,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             
             self.supabase.update_job_status(
                 job_id,
@@ -4,25 +4,207 @@ Handles uploading videos to YouTube using YouTube Data API v3
 """
 
 import os
+import json
+import logging
+import mmap
+import mimetypes
+import time
+import random
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, List, Callable
+import httpx
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google.auth.exceptions import GoogleAuthError
+import google_auth_httplib2
+import httplib2
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaUpload
 from googleapiclient.errors import HttpError
-import pickle
-from config import YOUTUBE_CLIENT_ID, YOUTUBE_CLIENT_SECRET
+from config import YOUTUBE_CLIENT_ID, YOUTUBE_CLIENT_SECRET, YOUTUBE_RESUMABLE_THRESHOLD_MB
 
 
+logger = logging.getLogger(__name__)
+
 # YouTube API scopes
 SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
 
+# videos.insert parts (the top-level keys of the body built by _video_body)
+_INSERT_PARTS = 'snippet,status'
+# Shared default for videos without tags (serialized as an empty JSON list)
+_EMPTY_TAGS = ()
+
+# Resumable upload chunks must be a multiple of 256 KiB
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+RESUMABLE_THRESHOLD = YOUTUBE_RESUMABLE_THRESHOLD_MB * 1024 * 1024
+# Endpoints called directly over HTTP/2 (the googleapiclient transport is HTTP/1.1 only)
+THUMBNAILS_SET_URL = "https://www.googleapis.com/upload/youtube/v3/thumbnails/set"
+VIDEOS_LIST_URL = "https://www.googleapis.com/youtube/v3/videos"
+
+# Authenticated API clients shared by every uploader in the process, keyed by
+# (credentials_path, token_path)
+_SERVICE_CACHE: Dict[Tuple[Path, Path], Any] = {}
+# Credentials behind each cached client, same keys
+_CREDENTIALS_CACHE: Dict[Tuple[Path, Path], Credentials] = {}
+# Background token refresh timers, same keys (see YouTubeUploader._schedule_refresh)
+_REFRESH_TIMERS: Dict[Tuple[Path, Path], threading.Timer] = {}
+_SERVICE_CACHE_LOCK = threading.RLock()
+
+# Refresh the OAuth token this long before it expires, so API calls never wait on a refresh
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+# Retry delay (seconds) after a failed background refresh
+TOKEN_REFRESH_RETRY = 60
+# Socket timeout (seconds) for the API client's keep-alive connection
+API_HTTP_TIMEOUT = 60
+# Resumable upload chunks failing with these statuses (or a connection error) are retried
+# with backoff (see _call_with_retry). The single-request upload is never retried: repeating
+# it after YouTube accepted the video would create a duplicate.
+RETRIABLE_STATUS_CODES = (500, 502, 503, 504)
+MAX_CHUNK_RETRIES = 8
+# Minimum seconds between upload progress lines
+PROGRESS_PRINT_INTERVAL = 0.5
+# videos.list accepts at most this many comma-separated IDs per call
+VIDEOS_LIST_MAX_IDS = 50
+
+# HTTP/2 client shared by the direct API calls, so thumbnail sets and video lists multiplex
+# over one connection
+_HTTP_CLIENT = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=10),
+    timeout=API_HTTP_TIMEOUT
+)
+
+
+def _call_with_retry(request_fn: Callable[[], Any]) -> Any:
+    """
+    Send one resumable upload chunk (request_fn is a next_chunk), retrying 5xx and connection
+    errors
+    
+    Retries wait min(32, 2**attempt) seconds plus up to 1s of jitter. The session keeps
+    everything sent so far, so a retry only resends the failed chunk. Only use this for
+    resumable chunks - other requests (e.g. a single-request videos.insert) aren't safe to repeat.
+    """
+    for attempt in range(MAX_CHUNK_RETRIES):
+        try:
+            return request_fn()
+        except (HttpError, OSError, httplib2.HttpLib2Error) as e:
+            if isinstance(e, HttpError) and e.resp.status not in RETRIABLE_STATUS_CODES:
+                raise
+            if attempt + 1 >= MAX_CHUNK_RETRIES:
+                raise
+            delay = min(32, 2 ** attempt) + random.random()
+            logger.warning("  🔁 Upload chunk failed (%s), retrying in %.1fs...", e, delay)
+            time.sleep(delay)
+
+
+def _aligned_chunk_size(chunk_size: int) -> int:
+    """Round a chunk size down to a multiple of UPLOAD_CHUNK_ALIGNMENT (at least one unit)"""
+    return max(UPLOAD_CHUNK_ALIGNMENT, chunk_size - chunk_size % UPLOAD_CHUNK_ALIGNMENT)
+
+
+class _UploadProgress:
+    """
+    Throttled upload progress logger
+    
+    Logs (at INFO) only when the whole percentage changed and at least PROGRESS_PRINT_INTERVAL
+    seconds passed, so small chunks on a fast link don't turn stdout into the bottleneck.
+    """
+    
+    def __init__(self, total_bytes: int, label: str = "Upload progress"):
+        self.total_bytes = total_bytes
+        self.label = label
+        self.last_bytes = 0
+        self.last_pct = -1
+        self.last_time = time.monotonic()
+    
+    def update(self, sent_bytes: int):
+        """Report that sent_bytes of the file are uploaded"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        now = time.monotonic()
+        pct = int(sent_bytes * 100 / max(self.total_bytes, 1))
+        if pct == self.last_pct or now - self.last_time < PROGRESS_PRINT_INTERVAL:
+            return
+        rate = (sent_bytes - self.last_bytes) / (now - self.last_time)
+        logger.info("  📤 %s: %d%% (%.1f MiB/s)", self.label, pct, rate / (1024 * 1024))
+        self.last_bytes, self.last_pct, self.last_time = sent_bytes, pct, now
+
+
+@functools.lru_cache(maxsize=16)
+def _thumbnail_bytes(path: str, mtime_ns: int) -> bytes:
+    """
+    Contents of a thumbnail file, cached per (path, mtime)
+    
+    The same few images are reused across many uploads, so most calls skip the disk read;
+    the mtime in the key makes an edited file miss the cache.
+    """
+    return Path(path).read_bytes()
+
+
+class MMapMediaUpload(MediaUpload):
+    """
+    Resumable media upload whose chunks are sliced from a read-only mmap of the file
+    
+    Chunks come straight from the page cache instead of seek()/read() through a buffered
+    file object, and the kernel is told the file is read sequentially so it reads ahead.
+    Call close() when the upload is done.
+    """
+    
+    def __init__(self, path: Path, mimetype: str, chunksize: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+                 size: Optional[int] = None):
+        super().__init__()
+        self._file = open(path, 'rb')
+        try:
+            fileno = self._file.fileno()
+            # Callers that already stat'ed the file pass its size to skip another stat
+            self._size = size if size is not None else os.fstat(fileno).st_size
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fileno, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            self._mm = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        if hasattr(self._mm, 'madvise'):
+            self._mm.madvise(mmap.MADV_SEQUENTIAL)
+        self._mimetype = mimetype
+        self._chunksize = chunksize
+    
+    def chunksize(self) -> int:
+        return self._chunksize
+    
+    def mimetype(self) -> str:
+        return self._mimetype
+    
+    def size(self) -> int:
+        return self._size
+    
+    def resumable(self) -> bool:
+        return True
+    
+    def has_stream(self) -> bool:
+        return False
+    
+    def getbytes(self, begin: int, length: int) -> bytes:
+        # The HTTP layer needs bytes, so this is the one copy out of the mapping
+        return self._mm[begin:begin + length]
+    
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
 
 class YouTubeUploader:
     """Handle YouTube video uploads"""
     
+    # Thumbnail uploads run here so upload_video can return as soon as the video is in
+    _thumb_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="yt_thumbnail")
+    
     def __init__(self, credentials_path: Optional[Path] = None, token_path: Optional[Path] = None):
         """
         Initialize YouTube uploader
@@ -32,20 +214,111 @@ class YouTubeUploader:
             token_path: Path to store/load OAuth token
         """
         self.credentials_path = credentials_path or Path.home() / ".youtube_credentials.json"
-        self.token_path = token_path or Path.home() / ".youtube_token.pickle"
-        self.service = None
-        self._authenticate()
+        self.token_path = token_path or Path.home() / ".youtube_token.json"
     
-    def _authenticate(self):
-        """Authenticate with YouTube API"""
-        creds = None
+    @classmethod
+    def preauth(cls, credentials_path: Optional[Path] = None,
+                token_path: Optional[Path] = None) -> "YouTubeUploader":
+        """Create an uploader and authenticate right away instead of on the first API call"""
+        uploader = cls(credentials_path, token_path)
+        uploader.service
+        return uploader
+    
+    @property
+    def service(self):
+        """YouTube API client, authenticated on first use and shared with other uploaders"""
+        key = (self.credentials_path, self.token_path)
+        with _SERVICE_CACHE_LOCK:
+            if key not in _SERVICE_CACHE:
+                _SERVICE_CACHE[key] = self._authenticate()
+            return _SERVICE_CACHE[key]
+    
+    @property
+    def credentials(self) -> Credentials:
+        """OAuth credentials used by the API client (authenticates on first use)"""
+        self.service
+        return _CREDENTIALS_CACHE[(self.credentials_path, self.token_path)]
+    
+    def close(self):
+        """Stop the background token refresh for this uploader's credentials"""
+        with _SERVICE_CACHE_LOCK:
+            timer = _REFRESH_TIMERS.pop((self.credentials_path, self.token_path), None)
+        if timer:
+            timer.cancel()
+    
+    def _schedule_refresh(self, creds: Credentials, delay: Optional[float] = None):
+        """
+        Refresh creds in the background TOKEN_REFRESH_MARGIN before they expire
         
-        # Load existing token
+        The API client holds the same Credentials object, so it picks up the new token
+        without being rebuilt. If a refresh is missed, the client still refreshes inline.
+        """
+        if not creds.refresh_token or (delay is None and not creds.expiry):
+            return
+        if delay is None:
+            delay = (creds.expiry - datetime.utcnow() - TOKEN_REFRESH_MARGIN).total_seconds()
+        
+        timer = threading.Timer(max(delay, 0), self._refresh_token, args=(creds,))
+        timer.daemon = True
+        with _SERVICE_CACHE_LOCK:
+            previous = _REFRESH_TIMERS.get((self.credentials_path, self.token_path))
+            if previous:
+                previous.cancel()
+            _REFRESH_TIMERS[(self.credentials_path, self.token_path)] = timer
+        timer.start()
+    
+    def _refresh_token(self, creds: Credentials):
+        """Timer callback: refresh and save the token, then schedule the next refresh"""
+        try:
+            creds.refresh(Request())
+            self._save_token(creds)
+        except Exception as e:
+            logger.warning("  ⚠️  Background YouTube token refresh failed: %s", e)
+            self._schedule_refresh(creds, delay=TOKEN_REFRESH_RETRY)
+            return
+        self._schedule_refresh(creds)
+    
+    def _load_token(self) -> Optional[Credentials]:
+        """Load saved credentials, migrating a legacy pickle token to JSON"""
         if self.token_path.exists():
-            with open(self.token_path, 'rb') as token:
+            with open(self.token_path, 'r') as token:
+                return Credentials.from_authorized_user_info(json.load(token), SCOPES)
+        
+        legacy_path = self.token_path.with_suffix('.pickle')
+        if legacy_path.exists():
+            logger.info("  🔄 Migrating YouTube token from %s to %s", legacy_path.name, self.token_path.name)
+            # One-time migration, so pickle is only imported when an old token is found
+            import pickle
+            with open(legacy_path, 'rb') as token:
                 creds = pickle.load(token)
+            self._save_token(creds)
+            legacy_path.unlink()
+            return creds
+        
+        return None
+    
+    def _save_token(self, creds: Credentials):
+        """
+        Save credentials for next run (JSON, readable only by the current user)
         
-        # If no valid credentials, get new ones
+        Written to a temp file and renamed into place, so other uploader processes never
+        read a half-written token. Only called when the credentials changed.
+        """
+        partial_path = self.token_path.with_name(f"{self.token_path.name}.{os.getpid()}_{threading.get_ident()}.tmp")
+        try:
+            fd = os.open(partial_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, 'w') as token:
+                token.write(creds.to_json())
+            os.replace(partial_path, self.token_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+    
+    def _authenticate(self):
+        """Authenticate with YouTube API and return the API client"""
+        # Load existing token
+        creds = self._load_token()
+        
+        # If no valid credentials, get new ones (a valid token from disk is not rewritten)
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 creds.refresh(Request())
@@ -54,9 +327,6 @@ class YouTubeUploader:
                 if not self.credentials_path.exists():
                     # Try using environment variables if file doesn't exist
                     if YOUTUBE_CLIENT_ID and YOUTUBE_CLIENT_SECRET:
-                        # Create a temporary credentials dict
-                        import json
-                        import tempfile
                         creds_dict = {
                             "installed": {
                                 "client_id": YOUTUBE_CLIENT_ID,
@@ -66,11 +336,7 @@ class YouTubeUploader:
                                 "redirect_uris": ["http://localhost"]
                             }
                         }
-                        # Create temp file for credentials
-                        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-                        json.dump(creds_dict, temp_file)
-                        temp_file.close()
-                        credentials_file = temp_file.name
+                        flow = InstalledAppFlow.from_client_config(creds_dict, SCOPES)
                     else:
                         raise FileNotFoundError(
                             f"OAuth credentials file not found: {self.credentials_path}\n"
@@ -80,25 +346,21 @@ class YouTubeUploader:
                             "See YOUTUBE_API_SETUP.md for detailed instructions"
                         )
                 else:
-                    credentials_file = str(self.credentials_path)
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        str(self.credentials_path), SCOPES)
                 
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    credentials_file, SCOPES)
                 creds = flow.run_local_server(port=0)
-                
-                # Clean up temp file if we created one
-                if not self.credentials_path.exists() and YOUTUBE_CLIENT_ID:
-                    import os
-                    try:
-                        os.unlink(credentials_file)
-                    except:
-                        pass
             
             # Save credentials for next run
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(creds, token)
+            self._save_token(creds)
+        
+        self._schedule_refresh(creds)
+        _CREDENTIALS_CACHE[(self.credentials_path, self.token_path)] = creds
         
-        self.service = build('youtube', 'v3', credentials=creds)
+        # Use the discovery document bundled with the client library (no fetch, no file cache)
+        # and a single authorized keep-alive connection for every API call
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=API_HTTP_TIMEOUT))
+        return build('youtube', 'v3', http=http, cache_discovery=False, static_discovery=True)
     
     def upload_video(
         self,
@@ -108,7 +370,8 @@ class YouTubeUploader:
         tags: Optional[list] = None,
         category_id: str = "22",  # People & Blogs
         privacy_status: str = "private",  # private, unlisted, or public
-        thumbnail_path: Optional[Path] = None
+        thumbnail_path: Optional[Path] = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE
     ) -> Dict[str, Any]:
         """
         Upload a video to YouTube
@@ -121,97 +384,168 @@ class YouTubeUploader:
             category_id: YouTube category ID (default: 22 = People & Blogs)
             privacy_status: private, unlisted, or public
             thumbnail_path: Optional path to thumbnail image
+            chunk_size: Bytes sent per resumable request (rounded down to a multiple of 256 KiB),
+                        so memory stays bounded and a dropped connection only loses one chunk.
+                        Videos under RESUMABLE_THRESHOLD skip the resumable session and go up
+                        in a single request.
         
         Returns:
-            Dictionary with video_id and video_url
+            Dictionary with video_id, video_url, title and thumbnail_future (a Future resolving
+            to True once the thumbnail is set, or None when no thumbnail was given)
         """
-        if not video_path.exists():
+        try:
+            video_size = video_path.stat().st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"Video file not found: {video_path}")
+        resumable = video_size >= RESUMABLE_THRESHOLD
         
-        body = {
-            'snippet': {
-                'title': title,
-                'description': description,
-                'tags': tags or [],
-                'categoryId': category_id
-            },
-            'status': {
-                'privacyStatus': privacy_status,
-                'selfDeclaredMadeForKids': False  # Set to "No, it's not made for kids"
-            }
-        }
+        body = self._video_body(title, description, tags, category_id, privacy_status)
+        chunk_size = _aligned_chunk_size(chunk_size)
         
         # Create media upload object
-        media = MediaFileUpload(
-            str(video_path),
-            chunksize=-1,
-            resumable=True,
-            mimetype='video/mp4'
-        )
+        if resumable:
+            media = MMapMediaUpload(video_path, mimetype='video/mp4', chunksize=chunk_size, size=video_size)
+        else:
+            media = MediaFileUpload(str(video_path), resumable=False, mimetype='video/mp4')
         
         try:
             # Insert video
             insert_request = self.service.videos().insert(
-                part=','.join(body.keys()),
+                part=_INSERT_PARTS,
                 body=body,
                 media_body=media
             )
             
-            # Execute upload
-            response = None
-            while response is None:
-                status, response = insert_request.next_chunk()
-                if status:
-                    print(f"  📤 Upload progress: {int(status.progress() * 100)}%")
+            if not resumable:
+                # Small video: one multipart request, no resumable session round trips
+                logger.info("  📤 Uploading %.1f MiB in a single request...", video_size / (1024 * 1024))
+                response = insert_request.execute()
+            else:
+                # Execute upload, logging throughput so stalls are visible
+                response = None
+                progress = _UploadProgress(video_size)
+                while response is None:
+                    status, response = _call_with_retry(insert_request.next_chunk)
+                    if status:
+                        progress.update(status.resumable_progress)
             
             video_id = response['id']
             video_url = f"https://www.youtube.com/watch?v={video_id}"
             
-            # Upload thumbnail if provided
-            if thumbnail_path and thumbnail_path.exists():
-                try:
-                    self.service.thumbnails().set(
-                        videoId=video_id,
-                        media_body=MediaFileUpload(str(thumbnail_path))
-                    ).execute()
-                    print(f"  ✅ Thumbnail uploaded")
-                except HttpError as e:
-                    print(f"  ⚠️  Failed to upload thumbnail: {e}")
+            # Upload thumbnail if provided, in the background
+            thumbnail_future = None
+            if thumbnail_path:
+                thumbnail_future = self._thumb_executor.submit(self._set_thumbnail, video_id, thumbnail_path)
             
             return {
                 "video_id": video_id,
                 "video_url": video_url,
-                "title": title
+                "title": title,
+                "thumbnail_future": thumbnail_future
             }
             
         except HttpError as e:
             error_details = e.error_details[0] if e.error_details else {}
             error_msg = error_details.get('message', str(e))
             raise Exception(f"YouTube API error: {error_msg}")
+        finally:
+            if isinstance(media, MMapMediaUpload):
+                media.close()
+    
+    def _auth_headers(self) -> Dict[str, str]:
+        """Authorization header for direct API calls, refreshing an expired token first"""
+        creds = self.credentials
+        if not creds.valid:
+            creds.refresh(Request())
+        return {"Authorization": f"Bearer {creds.token}"}
+    
+    @staticmethod
+    def _video_body(title: str, description: str, tags: Optional[list],
+                    category_id: str, privacy_status: str) -> Dict[str, Any]:
+        """videos.insert request body"""
+        return {
+            'snippet': {
+                'title': title,
+                'description': description,
+                'tags': tags if tags is not None else _EMPTY_TAGS,
+                'categoryId': category_id
+            },
+            'status': {
+                'privacyStatus': privacy_status,
+                'selfDeclaredMadeForKids': False  # Set to "No, it's not made for kids"
+            }
+        }
+    
+    def _set_thumbnail(self, video_id: str, thumbnail_path: Path) -> bool:
+        """Set a video's thumbnail; failures are logged, not raised"""
+        try:
+            thumbnail_bytes = _thumbnail_bytes(str(thumbnail_path), thumbnail_path.stat().st_mtime_ns)
+            response = _HTTP_CLIENT.post(
+                THUMBNAILS_SET_URL,
+                params={"videoId": video_id, "uploadType": "media"},
+                headers={
+                    **self._auth_headers(),
+                    "Content-Type": mimetypes.guess_type(thumbnail_path.name)[0] or "image/jpeg"
+                },
+                content=thumbnail_bytes
+            )
+            response.raise_for_status()
+            logger.info("  ✅ Thumbnail uploaded")
+            return True
+        except FileNotFoundError:
+            # The stat for the cache key doubles as the existence check
+            logger.warning("  ⚠️  Thumbnail not found: %s", thumbnail_path)
+            return False
+        except (httpx.HTTPError, GoogleAuthError) as e:
+            # GoogleAuthError: the token refresh in _auth_headers failed
+            logger.warning("  ⚠️  Failed to upload thumbnail: %s", e)
+            return False
     
     def get_video_info(self, video_id: str) -> Dict[str, Any]:
         """Get information about an uploaded video"""
+        return self.get_videos_info([video_id])[0]
+    
+    def get_videos_info(self, video_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get information about several uploaded videos, 50 IDs per API call
+        
+        Returns:
+            List aligned with video_ids; entries are None for videos that weren't found
+            (or for every video if the API call fails)
+        """
+        videos = {}
         try:
-            response = self.service.videos().list(
-                part='snippet,statistics,status',
-                id=video_id
-            ).execute()
-            
-            if not response['items']:
-                return None
-            
-            video = response['items'][0]
-            return {
-                "video_id": video_id,
-                "title": video['snippet']['title'],
-                "description": video['snippet']['description'],
-                "published_at": video['snippet']['publishedAt'],
-                "view_count": int(video['statistics'].get('viewCount', 0)),
-                "like_count": int(video['statistics'].get('likeCount', 0)),
-                "comment_count": int(video['statistics'].get('commentCount', 0)),
-                "privacy_status": video['status']['privacyStatus']
-            }
-        except HttpError as e:
-            print(f"Error getting video info: {e}")
-            return None
-
+            for start in range(0, len(video_ids), VIDEOS_LIST_MAX_IDS):
+                chunk = video_ids[start:start + VIDEOS_LIST_MAX_IDS]
+                response = _HTTP_CLIENT.get(
+                    VIDEOS_LIST_URL,
+                    params={
+                        "part": "snippet,statistics,status",
+                        "id": ','.join(chunk),
+                        "maxResults": VIDEOS_LIST_MAX_IDS
+                    },
+                    headers=self._auth_headers()
+                )
+                response.raise_for_status()
+                for video in response.json()['items']:
+                    videos[video['id']] = video
+        except httpx.HTTPError as e:
+            logger.error("Error getting video info: %s", e)
+            return [None] * len(video_ids)
+        
+        return [self._video_info(videos[video_id]) if video_id in videos else None
+                for video_id in video_ids]
+    
+    @staticmethod
+    def _video_info(video: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a videos.list item"""
+        return {
+            "video_id": video['id'],
+            "title": video['snippet']['title'],
+            "description": video['snippet']['description'],
+            "published_at": video['snippet']['publishedAt'],
+            "view_count": int(video['statistics'].get('viewCount', 0)),
+            "like_count": int(video['statistics'].get('likeCount', 0)),
+            "comment_count": int(video['statistics'].get('commentCount', 0)),
+            "privacy_status": video['status']['privacyStatus']
+        }
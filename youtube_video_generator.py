@@ -9,39 +9,45 @@ import sys
 import argparse
 import subprocess
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Union, BinaryIO, NamedTuple, TYPE_CHECKING
+import json
 import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import multiprocessing
+import hashlib
+import threading
+import functools
+import importlib.util
+from collections import OrderedDict
 
-# Fix for PIL.Image.ANTIALIAS compatibility issue with newer Pillow versions
-# This must be done before importing moviepy
-try:
-    from PIL import Image
-    if not hasattr(Image, 'ANTIALIAS'):
-        Image.ANTIALIAS = Image.LANCZOS
-except ImportError:
-    pass
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
 
 def check_dependencies():
-    """Check if required dependencies are installed"""
-    missing = []
-    
+    """Check if required dependencies are installed (find_spec locates them without importing)"""
+    # Start the ffmpeg probe first so the subprocess runs while the modules are located
     try:
-        import edge_tts
-    except ImportError:
-        missing.append("edge-tts")
+        ffmpeg_probe = subprocess.Popen(
+            ["ffmpeg", "-version"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    except OSError:
+        ffmpeg_probe = None
     
-    try:
-        import moviepy.editor as mp
-    except ImportError:
-        missing.append("moviepy")
+    missing = []
     
-    try:
-        import whisper
-    except ImportError:
-        missing.append("openai-whisper")
+    for module, package in (
+        ("edge_tts", "edge-tts"),
+        ("faster_whisper", "faster-whisper"),
+    ):
+        if importlib.util.find_spec(module) is None:
+            missing.append(package)
+    
+    # Check for ffmpeg
+    ffmpeg_found = ffmpeg_probe is not None and ffmpeg_probe.wait() == 0
     
     if missing:
         print("❌ Missing required dependencies:")
@@ -50,10 +56,7 @@ def check_dependencies():
         print("\nInstall with: pip install " + " ".join(missing))
         return False
     
-    # Check for ffmpeg
-    try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not ffmpeg_found:
         print("⚠️  FFmpeg not found. Install with: brew install ffmpeg")
         print("   (Required for video rendering)")
         return False
@@ -61,63 +64,374 @@ def check_dependencies():
     return True
 
 
-def generate_voiceover(script_text: str, output_path: Path, voice: str = None) -> Tuple[bool, float]:
+# Auto-selected edge-tts voice; list_voices() is a network round trip, so it runs once per process
+_AUTO_VOICE: Optional[str] = None
+
+# LRU of synthesized MP3 bytes keyed by md5(voice|text), so repeated chunks (intros, outros)
+# never re-hit the TTS service
+_TTS_CACHE: "OrderedDict[str, bytes]" = OrderedDict()
+_TTS_CACHE_MAX_ENTRIES = 64
+_TTS_CACHE_LOCK = threading.Lock()
+
+
+async def _select_voice(voice: Optional[str]) -> str:
+    """Return the edge-tts voice to use, auto-selecting a natural English voice if none is given"""
+    global _AUTO_VOICE
+    import edge_tts
+    
+    # Handle empty string as None (auto-select)
+    if voice is None or voice == "":
+        if _AUTO_VOICE is not None:
+            return _AUTO_VOICE
+        # Get list of voices and select a natural-sounding one
+        voices = await edge_tts.list_voices()
+        # Prefer English voices that sound natural
+        preferred_voices = [
+            v for v in voices 
+            if "en" in v.get("Locale", "").lower() 
+            and "natural" in v.get("ShortName", "").lower()
+        ]
+        if preferred_voices:
+            _AUTO_VOICE = preferred_voices[0]["ShortName"]
+        else:
+            # Fallback to any English voice
+            english_voices = [v for v in voices if "en" in v.get("Locale", "").lower()]
+            _AUTO_VOICE = english_voices[0]["ShortName"] if english_voices else "en-US-AriaNeural"
+        return _AUTO_VOICE
+    return voice
+
+
+def _tts_cache_get(key: str) -> Optional[bytes]:
+    with _TTS_CACHE_LOCK:
+        data = _TTS_CACHE.get(key)
+        if data is not None:
+            _TTS_CACHE.move_to_end(key)
+        return data
+
+
+def _tts_cache_put(key: str, data: bytes) -> None:
+    with _TTS_CACHE_LOCK:
+        _TTS_CACHE[key] = data
+        _TTS_CACHE.move_to_end(key)
+        while len(_TTS_CACHE) > _TTS_CACHE_MAX_ENTRIES:
+            _TTS_CACHE.popitem(last=False)
+
+
+def resolve_voice(voice: Optional[str] = None) -> str:
+    """The edge-tts voice actually used for voice (None or empty = the auto-selected voice)"""
+    if voice:
+        return voice
+    if _AUTO_VOICE is not None:
+        return _AUTO_VOICE
+    import asyncio
+    return asyncio.run(_select_voice(voice))
+
+
+def synthesize_speech(text: str, output: Union[Path, BinaryIO], voice: str = None) -> bool:
+    """
+    Synthesize text to MP3 with edge-tts
+    Lightweight variant of generate_voiceover for chunked generation (no duration probe, no logging)
+    Results are kept in a small in-memory LRU, so repeated text is only synthesized once
+    
+    Args:
+        output: File path, or a binary file object the audio is streamed into as it arrives
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        import edge_tts
+        import asyncio
+        
+        async def _synthesize():
+            selected_voice = await _select_voice(voice)
+            key = hashlib.md5(f"{selected_voice}|{text}".encode("utf-8")).hexdigest()
+            
+            data = _tts_cache_get(key)
+            if data is None:
+                communicate = edge_tts.Communicate(text, selected_voice)
+                chunks = []
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        chunks.append(chunk["data"])
+                        if not isinstance(output, (str, Path)):
+                            output.write(chunk["data"])
+                data = b"".join(chunks)
+                _tts_cache_put(key, data)
+                if not isinstance(output, (str, Path)):
+                    return
+            
+            if isinstance(output, (str, Path)):
+                Path(output).write_bytes(data)
+            else:
+                output.write(data)
+        
+        asyncio.run(_synthesize())
+        return True
+        
+    except Exception as e:
+        print(f"  ❌ Error synthesizing speech: {e}")
+        return False
+
+
+# edge-tts reports WordBoundary offsets and durations in 100 ns ticks
+_TICKS_PER_SECOND = 10_000_000
+
+
+def generate_voiceover(script_text: str, output_path: Path, voice: str = None) -> Tuple[bool, float, List[Dict]]:
     """
     Generate voiceover from text using edge-tts
+    Word timings come from the TTS engine's WordBoundary events, so no Whisper pass is needed
     
     Returns:
-        (success: bool, duration: float)
+        (success: bool, duration: float, word_timestamps: list of 'word', 'start', 'end' dicts;
+         empty if the engine sent no word boundaries)
     """
     try:
         import edge_tts
         import asyncio
         
         async def _generate():
-            # Handle empty string as None (auto-select)
-            if voice is None or voice == "":
-                # Get list of voices and select a natural-sounding one
-                voices = await edge_tts.list_voices()
-                # Prefer English voices that sound natural
-                preferred_voices = [
-                    v for v in voices 
-                    if "en" in v.get("Locale", "").lower() 
-                    and "natural" in v.get("ShortName", "").lower()
-                ]
-                if preferred_voices:
-                    selected_voice = preferred_voices[0]["ShortName"]
-                else:
-                    # Fallback to any English voice
-                    english_voices = [v for v in voices if "en" in v.get("Locale", "").lower()]
-                    selected_voice = english_voices[0]["ShortName"] if english_voices else "en-US-AriaNeural"
-            else:
-                selected_voice = voice
+            selected_voice = await _select_voice(voice)
             
             print(f"  🎤 Using voice: {selected_voice}")
             print(f"  🎵 Generating voiceover...")
             
-            communicate = edge_tts.Communicate(script_text, selected_voice)
-            await communicate.save(str(output_path))
+            communicate = edge_tts.Communicate(script_text, selected_voice, boundary="WordBoundary")
+            words = []
+            # Write audio as it streams in instead of buffering the whole voiceover
+            with open(output_path, "wb") as f:
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        f.write(chunk["data"])
+                    elif chunk["type"] == "WordBoundary":
+                        words.append({
+                            "word": chunk["text"].strip(),
+                            "start": chunk["offset"] / _TICKS_PER_SECOND,
+                            "end": (chunk["offset"] + chunk["duration"]) / _TICKS_PER_SECOND
+                        })
             
             # Get duration from the generated file
-            import moviepy.editor as mp
-            audio = mp.AudioFileClip(str(output_path))
-            duration = audio.duration
-            audio.close()
-            
-            return duration
+            return _probe_duration(output_path), words
         
-        duration = asyncio.run(_generate())
-        print(f"  ✅ Voiceover generated: {duration:.2f} seconds")
-        return True, duration
+        duration, words = asyncio.run(_generate())
+        print(f"  ✅ Voiceover generated: {duration:.2f} seconds ({len(words)} word timings)")
+        return True, duration, words
         
     except Exception as e:
         print(f"  ❌ Error generating voiceover: {e}")
         import traceback
         traceback.print_exc()
-        return False, 0.0
+        return False, 0.0, []
+
+
+def concat_audio_files(input_paths: List[Path], output_path: Path) -> bool:
+    """
+    Concatenate audio files (same codec/format) into one file
+    Uses FFmpeg's concat demuxer with stream copy - no decode or re-encode
+    """
+    list_path = output_path.parent / f".{output_path.stem}_concat.txt"
+    try:
+        with open(list_path, 'w', encoding='utf-8') as f:
+            for path in input_paths:
+                escaped = str(Path(path).absolute()).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-f", "concat",
+                "-safe", "0",
+                "-i", str(list_path),
+                "-c", "copy",
+                "-y",
+                str(output_path)
+            ],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL
+        )
+        
+        if result.returncode != 0:
+            print(f"  ❌ FFmpeg concat error: {result.stderr}")
+            return False
+        return True
+        
+    except Exception as e:
+        print(f"  ❌ Error concatenating audio: {e}")
+        return False
+    finally:
+        list_path.unlink(missing_ok=True)
+
+
+# ffmpeg -threads for a single invocation; overrides the CPU-count-based default when set
+_FFMPEG_THREADS_ENV = "FFMPEG_THREADS_PER_INVOCATION"
+_FFMPEG_THREADS_RANGE = (1, 64)
+
+
+def _ffmpeg_thread_count(value: Union[str, int]) -> int:
+    """Parse and validate an ffmpeg thread count (1-64)"""
+    threads = int(value)
+    low, high = _FFMPEG_THREADS_RANGE
+    if not low <= threads <= high:
+        raise ValueError(f"ffmpeg threads must be between {low} and {high}, got {threads}")
+    return threads
+
+
+def _ffmpeg_threads(n_workers: int = 1) -> int:
+    """
+    ffmpeg -threads for one of n_workers concurrent ffmpeg invocations
+    
+    Splits the CPU cores between the invocations so N renders don't each start cpu_count
+    threads. FFMPEG_THREADS_PER_INVOCATION in the environment overrides the split.
+    """
+    env_threads = os.getenv(_FFMPEG_THREADS_ENV)
+    if env_threads:
+        return _ffmpeg_thread_count(env_threads)
+    return max(1, (os.cpu_count() or 4) // max(1, n_workers))
+
+
+# Hardware H.264 encoders in order of preference, with their low-latency settings
+_HW_H264_ENCODERS = (
+    ("h264_videotoolbox", ["-b:v", "6M", "-realtime", "1"]),  # macOS
+    ("h264_nvenc", ["-preset", "p1", "-tune", "ll", "-cq", "23"]),  # NVIDIA
+    ("h264_qsv", ["-preset", "veryfast", "-global_quality", "23"]),  # Intel Quick Sync
+    ("h264_amf", ["-quality", "speed", "-rc", "cqp", "-qp_i", "23", "-qp_p", "23"]),  # AMD
+)
+
+_LIBX264_ARGS = [
+    "-preset", "ultrafast",  # Fastest encoding preset
+    "-crf", "23",  # Quality setting (18-28 range, 23 is good quality, higher = faster)
+    "-tune", "fastdecode",  # Optimize for fast decoding
+    "-profile:v", "high",  # High profile for better quality
+    "-level", "4.0",  # H.264 level for compatibility
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _video_encoder() -> Tuple[str, Tuple[str, ...]]:
+    """
+    Pick the fastest working H.264 encoder (probed once per process)
+    
+    An encoder listed by `ffmpeg -encoders` can still fail without the matching device or
+    driver, so each candidate is confirmed with a one-frame test encode.
+    
+    Returns:
+        (encoder name, encoder-specific ffmpeg args); libx264 if no hardware encoder works
+    """
+    try:
+        listed = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL
+        ).stdout
+    except OSError:
+        listed = ""
+    
+    for name, args in _HW_H264_ENCODERS:
+        if name not in listed:
+            continue
+        probe = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=size=256x256:rate=24",
+                "-frames:v", "1",
+                "-c:v", name, *args,
+                "-pix_fmt", "yuv420p",
+                "-f", "null", "-"
+            ],
+            capture_output=True,
+            stdin=subprocess.DEVNULL
+        )
+        if probe.returncode == 0:
+            print(f"  ⚡ Using hardware encoder: {name}")
+            return name, tuple(args)
+    
+    return "libx264", tuple(_LIBX264_ARGS)
+
+
+_VIDEO_EXTENSIONS = frozenset({".mp4", ".mov", ".avi", ".webm", ".m4v"})
+
+
+class BackgroundSegment(NamedTuple):
+    """Background footage for a video: render_final_video decodes, loops and composites it"""
+    path: Path
+    start: float  # Seconds into the source where the segment starts
+    duration: float  # Seconds of background needed (the voiceover duration)
+    width: int  # Source video width
+    height: int  # Source video height
 
 
-def compile_background_videos(folder_path: Path, target_duration: float, output_resolution: Tuple[int, int] = (1920, 1080)) -> Optional[object]:
+def _file_key(path: Union[str, Path]) -> Tuple[str, int, int]:
+    """Cache key for probe results: a replaced or rewritten file gets a fresh probe"""
+    st = os.stat(path)
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_duration_cached(path: str, mtime_ns: int, size: int) -> float:
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=nw=1:nk=1",
+            path
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        stdin=subprocess.DEVNULL
+    )
+    return float(result.stdout)
+
+
+def _probe_duration(path: Union[str, Path]) -> float:
+    """Media duration in seconds from ffprobe's container header (no decoding, cached per file)"""
+    return _probe_duration_cached(*_file_key(path))
+
+
+@functools.lru_cache(maxsize=64)
+def _probe_video_cached(path: str, mtime_ns: int, size: int) -> Tuple[float, int, int]:
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "stream=width,height:format=duration",
+            "-of", "json",
+            path
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        stdin=subprocess.DEVNULL
+    )
+    info = json.loads(result.stdout)
+    stream = info["streams"][0]
+    return float(info["format"]["duration"]), int(stream["width"]), int(stream["height"])
+
+
+def _probe_video(path: Path) -> Tuple[float, int, int]:
+    """
+    Read a video's duration and frame size with ffprobe (no decoding, cached per file)
+    
+    Returns:
+        (duration_seconds, width, height)
+    """
+    return _probe_video_cached(*_file_key(path))
+
+
+def _ranking_duration(path: str) -> float:
+    """Duration for picking the longest video; unreadable files rank last"""
+    try:
+        return _probe_duration(path)
+    except (subprocess.CalledProcessError, ValueError, OSError):
+        return 0.0
+
+
+def compile_background_videos(folder_path: Path, target_duration: float) -> Optional[BackgroundSegment]:
     """
     Optimized: Use WebsiteBackground.mp4 if available (pre-rendered, fastest option)
     Otherwise use longest video
@@ -125,13 +439,13 @@ def compile_background_videos(folder_path: Path, target_duration: float, output_
     Handles edge cases where random spot + duration would exceed video length
     
     Background video preprocessing: WebsiteBackground.mp4 is already pre-combined,
-    so we just need to extract a random segment - much faster than compiling on-the-fly.
+    so we just need to pick a random segment. Nothing is decoded here - the segment is
+    cut, looped and composited by ffmpeg in render_final_video.
     
     Returns:
-        VideoFileClip object or None
+        BackgroundSegment or None
     """
     try:
-        import moviepy.editor as mp
         import random
         
         print(f"  📁 Loading videos from: {folder_path}")
@@ -143,114 +457,50 @@ def compile_background_videos(folder_path: Path, target_duration: float, output_
             print(f"  ✅ Using WebsiteBackground.mp4 (pre-rendered, optimized!)")
             video_file = website_bg
         else:
-            # Fallback: Find the longest video
-            video_extensions = {".mp4", ".mov", ".avi", ".webm", ".m4v"}
-            video_files = [
-                f for f in folder_path.iterdir()
-                if f.is_file() and f.suffix.lower() in video_extensions
-            ]
+            # Fallback: Find the longest video by real duration (file size misranks videos
+            # with different bitrates); one scandir pass lists the candidates
+            with os.scandir(folder_path) as entries:
+                candidates = [
+                    e.path for e in entries
+                    if e.is_file() and os.path.splitext(e.name)[1].lower() in _VIDEO_EXTENSIONS
+                ]
             
-            if not video_files:
+            if not candidates:
                 print(f"  ❌ No video files found in {folder_path}")
                 return None
             
-            # Use longest video (by file size as proxy for duration)
-            video_file = max(video_files, key=lambda f: f.stat().st_size)
+            # ffprobe only reads container headers, so the probes run in parallel
+            with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+                durations = list(executor.map(_ranking_duration, candidates))
+            
+            video_file = Path(max(zip(durations, candidates))[1])
             print(f"  📹 Using longest video: {video_file.name}")
         
-        # Load video once for background, once for foreground
-        bg_source = mp.VideoFileClip(str(video_file))
-        fg_source = mp.VideoFileClip(str(video_file))
-        original_duration = bg_source.duration
+        original_duration, width, height = _probe_video(video_file)
         
         # Pick a random start point, ensuring we can get the full duration needed
         crop_duration = min(target_duration, original_duration)
+        max_start_point = original_duration - crop_duration
         
-        if original_duration >= crop_duration:
-            # Calculate max start point to ensure we don't go past the end
-            max_start_point = original_duration - crop_duration
-            
-            if max_start_point > 0:
-                # Pick random start point
-                random_start = random.uniform(0, max_start_point)
-                random_end = random_start + crop_duration
-                print(f"  🎲 Random segment: {random_start:.2f}s - {random_end:.2f}s (duration: {crop_duration:.2f}s)")
-                print(f"     Video length: {original_duration:.2f}s, available range: 0 - {max_start_point:.2f}s")
-            else:
-                # Video is exactly the right length or shorter, use from start
-                random_start = 0
-                random_end = crop_duration
-                print(f"  ✂️  Using from start: 0s - {crop_duration:.2f}s (video is {original_duration:.2f}s)")
+        if max_start_point > 0:
+            # Pick random start point
+            random_start = random.uniform(0, max_start_point)
+            random_end = random_start + crop_duration
+            print(f"  🎲 Random segment: {random_start:.2f}s - {random_end:.2f}s (duration: {crop_duration:.2f}s)")
+            print(f"     Video length: {original_duration:.2f}s, available range: 0 - {max_start_point:.2f}s")
+        elif original_duration >= target_duration:
+            # Video is exactly the right length, use from start
+            random_start = 0
+            print(f"  ✂️  Using from start: 0s - {crop_duration:.2f}s (video is {original_duration:.2f}s)")
         else:
-            # Video is shorter than needed, use entire video
+            # Video is shorter than needed: use the entire video, looped by ffmpeg
             random_start = 0
-            random_end = original_duration
-            crop_duration = original_duration
+            loops_needed = int(target_duration / original_duration) + 1
             print(f"  ⚠️  Video shorter than needed: using full video ({original_duration:.2f}s < {target_duration:.2f}s)")
+            print(f"  🔄 Looping video {loops_needed} times to match audio duration ({target_duration:.2f}s)")
         
-        # Extract the random segment
-        bg_segment = bg_source.subclip(random_start, random_end)
-        fg_segment = fg_source.subclip(random_start, random_end)
-        segment_duration = bg_segment.duration
-        
-        # Loop the segments to match target duration if needed
-        if segment_duration < target_duration:
-            # Calculate how many loops we need
-            loops_needed = int(target_duration / segment_duration) + 1
-            print(f"  🔄 Looping video segment {loops_needed} times to match audio duration ({target_duration:.2f}s)")
-            
-            # Loop the background segment
-            bg_clips = [bg_segment] * loops_needed
-            bg_looped = mp.concatenate_videoclips(bg_clips, method="compose")
-            bg_looped = bg_looped.subclip(0, target_duration)  # Trim to exact duration
-            
-            # Loop the foreground segment
-            fg_clips = [fg_segment] * loops_needed
-            fg_looped = mp.concatenate_videoclips(fg_clips, method="compose")
-            fg_looped = fg_looped.subclip(0, target_duration)  # Trim to exact duration
-        else:
-            # Segment is long enough, just trim to exact duration
-            bg_looped = bg_segment.subclip(0, target_duration)
-            fg_looped = fg_segment.subclip(0, target_duration)
-        
-        # Create scaled background layer (no blur)
-        scale_factor = output_resolution[0] / bg_looped.w
-        scale_factor = max(scale_factor, 1.15)
-        
-        bg_clip = bg_looped.resize(scale_factor)
-        # Crop to exact resolution if needed
-        if bg_clip.w > output_resolution[0] or bg_clip.h > output_resolution[1]:
-            x_center = bg_clip.w / 2
-            y_center = bg_clip.h / 2
-            bg_clip = bg_clip.crop(
-                x_center=x_center,
-                y_center=y_center,
-                width=output_resolution[0],
-                height=output_resolution[1]
-            )
-        
-        # Create foreground layer (original clip, centered)
-        fg_clip = fg_looped.resize(height=output_resolution[1])
-        fg_clip = fg_clip.set_position(('center', 'center'))
-        
-        # Ensure both clips have the exact same duration as target
-        bg_clip = bg_clip.set_duration(target_duration)
-        fg_clip = fg_clip.set_duration(target_duration)
-        
-        # Composite: background + foreground
-        final_clip = mp.CompositeVideoClip(
-            [bg_clip, fg_clip],
-            size=output_resolution,
-            duration=target_duration  # Explicitly set duration
-        )
-        
-        # Final safety check: ensure duration matches exactly
-        if abs(final_clip.duration - target_duration) > 0.1:
-            print(f"  ⚠️  Duration mismatch: {final_clip.duration:.2f}s vs {target_duration:.2f}s, fixing...")
-            final_clip = final_clip.set_duration(target_duration)
-        
-        print(f"  ✅ Background video ready: {final_clip.duration:.2f}s (matches audio: {target_duration:.2f}s)")
-        return final_clip
+        print(f"  ✅ Background video ready: {target_duration:.2f}s (matches audio: {target_duration:.2f}s)")
+        return BackgroundSegment(video_file, random_start, target_duration, width, height)
         
     except Exception as e:
         print(f"  ❌ Error compiling background videos: {e}")
@@ -259,33 +509,86 @@ def compile_background_videos(folder_path: Path, target_duration: float, output_
         return None
 
 
+def _escape_filter_value(value: str) -> str:
+    """
+    Escape a filter option value (e.g. a file path) for use inside an ffmpeg filtergraph
+    
+    ffmpeg unescapes twice: once when splitting the filtergraph (special: \\ ' [ ] , ;) and
+    once when splitting the filter's options (special: \\ ' :). Escaping in the reverse order
+    makes Windows paths like C:\\Users\\... and names with commas or brackets survive both.
+    """
+    for level_chars in ("\\':", "\\'[],;"):
+        for ch in level_chars:
+            value = value.replace(ch, "\\" + ch)
+    return value
+
+
+def _background_filtergraph(background: BackgroundSegment, resolution: Tuple[int, int], subtitle_filter: str) -> str:
+    """
+    ffmpeg filtergraph for the background composite plus burned-in subtitles
+    
+    The decoded segment is split into two layers: a background scaled up (at least 1.15x,
+    enough to fill the frame width) and center-cropped, and the original footage scaled to
+    the frame height and centered on top. One decode feeds both layers.
+    """
+    out_w, out_h = resolution
+    
+    scale = max(out_w / background.width, 1.15)
+    bg_w = int(background.width * scale) // 2 * 2
+    bg_h = int(background.height * scale) // 2 * 2
+    
+    return (
+        "[0:v]fps=24,split[bg_src][fg_src];"
+        # Background layer: scale up, center-crop to the frame, top-left aligned if smaller
+        f"[bg_src]scale={bg_w}:{bg_h},crop={min(bg_w, out_w)}:{min(bg_h, out_h)},pad={out_w}:{out_h}:0:0[bg];"
+        # Foreground layer: original footage at frame height
+        f"[fg_src]scale=-2:{out_h}[fg];"
+        f"[bg][fg]overlay=(W-w)/2:(H-h)/2,{subtitle_filter}[v]"
+    )
+
+
+# Loaded faster-whisper models, keyed by model name (loading one reads hundreds of MB)
+_WHISPER_MODELS: Dict[str, "WhisperModel"] = {}
+
+
+def _load_whisper_model(model_name: str) -> "WhisperModel":
+    """Return the faster-whisper model for model_name, loading it on first use"""
+    model = _WHISPER_MODELS.get(model_name)
+    if model is None:
+        from faster_whisper import WhisperModel
+        
+        # Always use CPU (no GPU support); int8 weights use CTranslate2's quantized kernels
+        model = WhisperModel(
+            model_name,
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=multiprocessing.cpu_count()
+        )
+        _WHISPER_MODELS[model_name] = model
+    return model
+
+
 def generate_word_timestamps(audio_path: Path, model_name: str = "base") -> Optional[List[Dict]]:
     """
-    Extract word-level timestamps from audio using Whisper
+    Extract word-level timestamps from audio using Whisper (faster-whisper, int8 on CPU)
     
     Returns:
         List of word dictionaries with 'word', 'start', 'end' keys
     """
     try:
-        import whisper
-        
         print(f"  🎤 Extracting word-level timestamps (model: {model_name})...")
         
-        # Always use CPU (no GPU support)
-        model = whisper.load_model(model_name, device="cpu")
-        result = model.transcribe(
-            str(audio_path),
-            word_timestamps=True,
-            fp16=False  # Disable fp16 for better compatibility
-        )
+        model = _load_whisper_model(model_name)
+        segments, _ = model.transcribe(str(audio_path), word_timestamps=True)
         
+        # segments is a generator: transcription runs as it is consumed
         words = []
-        for segment in result.get("segments", []):
-            for word_info in segment.get("words", []):
+        for segment in segments:
+            for word_info in segment.words or ():
                 words.append({
-                    "word": word_info["word"].strip(),
-                    "start": word_info["start"],
-                    "end": word_info["end"]
+                    "word": word_info.word.strip(),
+                    "start": word_info.start,
+                    "end": word_info.end
                 })
         
         print(f"  ✅ Extracted {len(words)} word timestamps")
@@ -298,64 +601,57 @@ def generate_word_timestamps(audio_path: Path, model_name: str = "base") -> Opti
         return None
 
 
+# Style: white text, 24pt font, bold, with outline
+# Alignment values: 1=bottom-left, 2=bottom-center, 3=bottom-right
+# Alignment=2 means bottom center
+# MarginV=20 means 20 pixels from bottom edge (very bottom)
+_ASS_HEADER = (
+    "[Script Info]\n"
+    "Title: YouTube Video Subtitles\n"
+    "ScriptType: v4.00+\n\n"
+    "[V4+ Styles]\n"
+    "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n"
+    "Style: Word,Arial,24,&Hffffff,&Hffffff,&H000000,&H80000000,1,0,0,0,100,100,0,0,1,4,2,2,10,10,20,1\n\n"
+    "[Events]\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+)
+
+
 def create_ass_subtitles(script_text: str, word_timestamps: List[Dict], output_path: Path) -> bool:
     """
     Create ASS subtitle file showing one word at a time at bottom center
+    The file is built in memory and written with a single call
     """
     try:
         print(f"  📝 Creating ASS subtitles (one word at a time)...")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            # Write ASS header
-            f.write("[Script Info]\n")
-            f.write("Title: YouTube Video Subtitles\n")
-            f.write("ScriptType: v4.00+\n\n")
-            
-            f.write("[V4+ Styles]\n")
-            f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
-            # Style: white text, 24pt font, bold, with outline
-            # Alignment values: 1=bottom-left, 2=bottom-center, 3=bottom-right
-            # Alignment=2 means bottom center
-            # MarginV=20 means 20 pixels from bottom edge (very bottom)
-            f.write("Style: Word,Arial,24,&Hffffff,&Hffffff,&H000000,&H80000000,1,0,0,0,100,100,0,0,1,4,2,2,10,10,20,1\n\n")
-            
-            f.write("[Events]\n")
-            f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-            
-            if not word_timestamps:
-                print("  ⚠️  No word timestamps available")
-                return False
-            
-            # Create one subtitle entry per word - no fade, same position
-            # Use ASS alignment (Alignment=2) for bottom center positioning
-            word_count = 0
-            
-            for i, word_info in enumerate(word_timestamps):
-                word = word_info["word"].strip()
-                if not word:
-                    continue
-                
-                word_start = word_info["start"]
-                # End time: either the word's end time, or the start of the next word (whichever comes first)
-                # This ensures no overlap - one word disappears exactly when next appears
-                if i + 1 < len(word_timestamps):
-                    next_word_start = word_timestamps[i + 1]["start"]
-                    word_end = min(word_info["end"], next_word_start)
-                else:
-                    word_end = word_info["end"]
-                
-                # Format timestamps - no overlap
-                start_time = format_ass_timestamp(word_start)
-                end_time = format_ass_timestamp(word_end)
-                
-                # Write single word subtitle - no fade, using style alignment
-                # Alignment=2 in style means bottom center
-                # No \pos override - let the style handle positioning
-                f.write(f"Dialogue: 0,{start_time},{end_time},Word,,0,0,0,,{word}\n")
-                word_count += 1
+        if not word_timestamps:
+            print("  ⚠️  No word timestamps available")
+            return False
+        
+        # Create one subtitle entry per word - no fade, same position
+        # Use ASS alignment (Alignment=2) for bottom center positioning
+        lines = [_ASS_HEADER]
+        # End time: either the word's end time, or the start of the next word (whichever comes first)
+        # This ensures no overlap - one word disappears exactly when next appears
+        next_starts = [w["start"] for w in word_timestamps[1:]]
+        next_starts.append(float("inf"))
+        
+        for word_info, next_word_start in zip(word_timestamps, next_starts):
+            word = word_info["word"].strip()
+            if not word:
+                continue
             
-            print(f"  ✅ Created {word_count} word subtitle(s)")
+            # Write single word subtitle - no fade, using style alignment
+            # No \pos override - let the style handle positioning
+            start_time = format_ass_timestamp(word_info["start"])
+            end_time = format_ass_timestamp(min(word_info["end"], next_word_start))
+            lines.append(f"Dialogue: 0,{start_time},{end_time},Word,,0,0,0,,{word}\n")
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("".join(lines))
         
+        print(f"  ✅ Created {len(lines) - 1} word subtitle(s)")
         print(f"  ✅ ASS subtitle file created: {output_path.name}")
         return True
         
@@ -368,79 +664,54 @@ def create_ass_subtitles(script_text: str, word_timestamps: List[Dict], output_p
 
 def format_ass_timestamp(seconds: float) -> str:
     """Format seconds to ASS timestamp format (H:MM:SS.cc)"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    centiseconds = int((seconds % 1) * 100)
+    minutes, centiseconds = divmod(int(seconds * 100), 6000)
+    hours, minutes = divmod(minutes, 60)
+    secs, centiseconds = divmod(centiseconds, 100)
     return f"{hours}:{minutes:02d}:{secs:02d}.{centiseconds:02d}"
 
 
 def render_final_video(
-    video_clip: object,
+    background: BackgroundSegment,
     audio_path: Path,
     subtitle_path: Path,
     output_path: Path,
-    resolution: Tuple[int, int] = (1920, 1080)
+    resolution: Tuple[int, int] = (1920, 1080),
+    threads: Optional[int] = None
 ) -> bool:
     """
     Combine background video, voiceover audio, and captions into final video
-    OPTIMIZED: Single-pass FFmpeg rendering (saves 1-2 minutes)
+    OPTIMIZED: One ffmpeg pass seeks into the source, loops it if needed, composites the
+    background layers, burns in the subtitles, muxes the audio and encodes once
+    
+    Args:
+        threads: ffmpeg -threads (default: _ffmpeg_threads(), all cores unless overridden)
     """
     try:
-        import moviepy.editor as mp
-        
-        print(f"  🎬 Rendering final video (optimized single-pass)...")
-        
-        # Load audio to get duration
-        audio_clip = mp.AudioFileClip(str(audio_path))
-        audio_duration = audio_clip.duration
-        audio_clip.close()  # Close immediately to free memory
-        
-        # Make sure video duration matches audio duration
-        if abs(video_clip.duration - audio_duration) > 0.1:
-            print(f"  ⚠️  Duration mismatch detected: video={video_clip.duration:.2f}s, audio={audio_duration:.2f}s")
-            print(f"  🔧 Adjusting video duration to match audio...")
-            video_clip = video_clip.set_duration(audio_duration)
-        
-        # Save video (without audio) to temp file for FFmpeg
-        temp_video = output_path.parent / f".temp_{output_path.name}"
-        print(f"  📹 Saving video clip (duration: {audio_duration:.2f}s)...")
-        video_clip.write_videofile(
-            str(temp_video),
-            codec='libx264',
-            audio=False,  # No audio - we'll add it with FFmpeg
-            fps=24,
-            preset='ultrafast',  # Fastest preset for speed
-            threads=multiprocessing.cpu_count(),  # Use all CPU cores
-            verbose=False,
-            logger=None,
-            write_logfile=False  # Disable logfile to avoid file conflicts
-        )
+        print(f"  🎬 Rendering final video (single ffmpeg pass, duration: {background.duration:.2f}s)...")
         
-        # Close video clip to free memory
-        video_clip.close()
+        subtitle_path_escaped = _escape_filter_value(str(subtitle_path))
+        subtitle_filter = f"subtitles={subtitle_path_escaped}:force_style='FontSize=24,PrimaryColour=&Hffffff,OutlineColour=&H000000,Outline=2,Alignment=2,MarginV=20,Bold=1'"
         
-        # Single-pass FFmpeg: combine video + audio + subtitles in one pass
-        print(f"  🚀 Combining video, audio, and subtitles (single-pass)...")
-        # Escape the subtitle path for ffmpeg (handle spaces and special chars)
-        subtitle_path_escaped = str(subtitle_path).replace("\\", "\\\\").replace(":", "\\:")
+        encoder, encoder_args = _video_encoder()
         
         cmd = [
             "ffmpeg",
-            "-i", str(temp_video),  # Video input
+            # Input seek (jumps to the nearest keyframe) and demuxer-level looping; a loop only
+            # happens when the source is shorter than the voiceover, and then start is 0
+            "-stream_loop", "-1",
+            "-ss", f"{background.start:.3f}",
+            "-i", str(background.path),  # Background video input
             "-i", str(audio_path),   # Audio input
-            "-vf", f"subtitles={subtitle_path_escaped}:force_style='FontSize=24,PrimaryColour=&Hffffff,OutlineColour=&H000000,Outline=2,Alignment=2,MarginV=20,Bold=1'",
-            "-c:v", "libx264",
-            "-preset", "ultrafast",  # Fastest encoding preset
-            "-crf", "23",  # Quality setting (18-28 range, 23 is good quality, higher = faster)
-            "-tune", "fastdecode",  # Optimize for fast decoding
-            "-profile:v", "high",  # High profile for better quality
-            "-level", "4.0",  # H.264 level for compatibility
+            "-filter_complex", _background_filtergraph(background, resolution, subtitle_filter),
+            "-map", "[v]",
+            "-map", "1:a",
+            "-t", f"{background.duration:.3f}",
+            "-c:v", encoder,
+            *encoder_args,
             "-pix_fmt", "yuv420p",  # Ensure compatibility
-            "-c:a", "aac",
-            "-b:a", "192k",  # High quality audio bitrate (192k is standard for good quality)
-            "-ar", "48000",  # High quality audio sample rate
-            "-threads", str(multiprocessing.cpu_count()),  # Use all CPU cores
+            "-c:a", "copy",  # Stream-copy the MP3 voiceover into the MP4 (no decode/re-encode)
+            # Cores for this invocation (hardware encoders still use them for decode and filters)
+            "-threads", str(threads or _ffmpeg_threads()),
             "-shortest",  # Ensure output duration matches shortest input (video or audio)
             "-y",
             str(output_path)
@@ -451,15 +722,9 @@ def render_final_video(
             cmd,
             capture_output=True,
             text=True,
-            stdin=subprocess.DEVNULL,  # Prevent stdin issues
-            stderr=subprocess.PIPE,    # Capture stderr separately
-            stdout=subprocess.PIPE     # Capture stdout separately
+            stdin=subprocess.DEVNULL  # Prevent stdin issues
         )
         
-        # Cleanup temp file
-        if temp_video.exists():
-            temp_video.unlink()
-        
         if result.returncode == 0:
             print(f"  ✅ Final video rendered: {output_path.name}")
             return True
@@ -475,6 +740,156 @@ def render_final_video(
         return False
 
 
+def _read_script(script_path: Path) -> Optional[str]:
+    """Read and validate a script file; prints the problem and returns None if unusable"""
+    if not script_path.exists():
+        print(f"❌ Script file not found: {script_path}")
+        return None
+    
+    try:
+        with open(script_path, 'r', encoding='utf-8') as f:
+            script_text = f.read().strip()
+    except Exception as e:
+        print(f"❌ Error reading script file: {e}")
+        return None
+    
+    if not script_text:
+        print(f"❌ Script file is empty: {script_path}")
+        return None
+    
+    print(f"📄 Script loaded: {len(script_text)} characters")
+    return script_text
+
+
+def _prepare_video(
+    script_text: str,
+    temp_dir: Path,
+    video_folder: Path,
+    whisper_model: str,
+    voice: Optional[str]
+) -> Optional[Tuple[BackgroundSegment, Path, Path, float]]:
+    """
+    Steps 1-4: voiceover, background segment, word timestamps and subtitles
+    
+    Returns:
+        (background, audio_path, subtitle_path, duration) ready for render_final_video,
+        or None if a step failed
+    """
+    # Step 1: Generate voiceover
+    print(f"\n{'='*60}")
+    print("STEP 1: Generating Voiceover")
+    print(f"{'='*60}")
+    audio_path = temp_dir / "voiceover.mp3"
+    success, duration, word_timestamps = generate_voiceover(script_text, audio_path, voice)
+    if not success:
+        print("❌ Failed to generate voiceover")
+        return None
+    
+    # Steps 2-4: background compilation and Whisper only need the voiceover, so they run
+    # in parallel; subtitles are built as soon as the timestamps are in, while the
+    # background may still be compiling. When edge-tts reported word timings, Whisper
+    # is skipped entirely.
+    print(f"\n{'='*60}")
+    print("STEPS 2-4: Background Videos + Word Timestamps + Subtitles (parallel)")
+    print(f"{'='*60}")
+    subtitle_path = temp_dir / "subtitles.ass"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        video_future = executor.submit(compile_background_videos, video_folder, duration)
+        stage_names = {video_future: "compile background videos"}
+        if word_timestamps:
+            print(f"  ⏭️  Using edge-tts word timings (skipping Whisper)")
+            if not create_ass_subtitles(script_text, word_timestamps, subtitle_path):
+                print("❌ Failed to create subtitles")
+                return None
+        else:
+            timestamps_future = executor.submit(generate_word_timestamps, audio_path, whisper_model)
+            stage_names[timestamps_future] = "extract word timestamps"
+        
+        # Fail as soon as either stage fails
+        for future in as_completed(stage_names):
+            if future.result() is None:
+                print(f"❌ Failed to {stage_names[future]}")
+                return None
+            if future is not video_future:
+                if not create_ass_subtitles(script_text, future.result(), subtitle_path):
+                    print("❌ Failed to create subtitles")
+                    return None
+        
+        background = video_future.result()
+    
+    return background, audio_path, subtitle_path, duration
+
+
+# Renders that overlap in --batch mode: one encodes while the next script is prepared
+_BATCH_RENDER_WORKERS = 2
+
+
+def _run_batch(args: argparse.Namespace) -> bool:
+    """
+    Generate a video for every .txt script in args.batch within this process
+    
+    The Whisper model, voice selection and ffprobe results stay cached between scripts.
+    Voiceovers are generated one at a time (edge-tts throttles parallel requests), while
+    each finished script's render runs in the background as the next one is prepared.
+    
+    Returns:
+        True if every video was created
+    """
+    import shutil
+    
+    script_paths = sorted(p for p in args.batch.glob("*.txt") if p.is_file())
+    if not script_paths:
+        print(f"❌ No .txt scripts found in {args.batch}")
+        return False
+    
+    output_dir = args.output or args.batch
+    output_dir.mkdir(parents=True, exist_ok=True)
+    threads = args.ffmpeg_threads_per_invocation or _ffmpeg_threads(_BATCH_RENDER_WORKERS)
+    print(f"📚 Batch: {len(script_paths)} script(s) -> {output_dir}")
+    
+    def render(prepared, temp_dir: Path, output_path: Path) -> bool:
+        try:
+            background, audio_path, subtitle_path, _ = prepared
+            return render_final_video(background, audio_path, subtitle_path, output_path, threads=threads)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    renders = {}
+    failed = []
+    with ThreadPoolExecutor(max_workers=_BATCH_RENDER_WORKERS) as render_pool:
+        for index, script_path in enumerate(script_paths, 1):
+            print(f"\n{'#'*60}")
+            print(f"[{index}/{len(script_paths)}] {script_path.name}")
+            print(f"{'#'*60}")
+            
+            script_text = _read_script(script_path)
+            if script_text is None:
+                failed.append(script_path)
+                continue
+            
+            temp_dir = Path(tempfile.mkdtemp(prefix="youtube_gen_"))
+            prepared = _prepare_video(script_text, temp_dir, args.video_folder, args.whisper_model, args.voice)
+            if prepared is None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                failed.append(script_path)
+                continue
+            
+            output_path = output_dir / f"{script_path.stem}_video.mp4"
+            print(f"  🎬 Queued render: {output_path.name}")
+            renders[render_pool.submit(render, prepared, temp_dir, output_path)] = script_path
+        
+        for future in as_completed(renders):
+            if not future.result():
+                failed.append(renders[future])
+    
+    print(f"\n{'='*60}")
+    print(f"✅ Batch complete: {len(script_paths) - len(failed)}/{len(script_paths)} video(s) created")
+    print(f"{'='*60}")
+    for script_path in failed:
+        print(f"   ❌ {script_path.name}")
+    return not failed
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate YouTube videos from text scripts with voiceover, background footage, and captions",
@@ -492,20 +907,33 @@ Examples:
   
   # Use different Whisper model for better accuracy
   python youtube_video_generator.py script.txt --whisper-model medium
+  
+  # Generate videos for every script in a folder
+  python youtube_video_generator.py --batch scripts/
         """
     )
     
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "script",
         type=Path,
+        nargs="?",
         help="Text file containing the script"
     )
     
+    source.add_argument(
+        "--batch",
+        type=Path,
+        default=None,
+        metavar="SCRIPTS_DIR",
+        help="Generate a video for every .txt script in this folder, in one process"
+    )
+    
     parser.add_argument(
         "-o", "--output",
         type=Path,
         default=None,
-        help="Output video file (default: script_name_video.mp4)"
+        help="Output video file (default: script_name_video.mp4); with --batch, the output folder"
     )
     
     parser.add_argument(
@@ -529,32 +957,31 @@ Examples:
         help="Edge-TTS voice to use (default: auto-select natural voice)"
     )
     
+    parser.add_argument(
+        "--ffmpeg-threads-per-invocation",
+        type=_ffmpeg_thread_count,
+        default=None,
+        help=f"ffmpeg -threads for the render, 1-64 (default: ${_FFMPEG_THREADS_ENV} or all CPU cores)"
+    )
+    
     args = parser.parse_args()
     
     # Check dependencies
     if not check_dependencies():
         sys.exit(1)
     
-    # Validate script file
-    script_path = args.script
-    if not script_path.exists():
-        print(f"❌ Script file not found: {script_path}")
-        sys.exit(1)
-    
-    # Read script
-    try:
-        with open(script_path, 'r', encoding='utf-8') as f:
-            script_text = f.read().strip()
-    except Exception as e:
-        print(f"❌ Error reading script file: {e}")
-        sys.exit(1)
+    if args.batch:
+        if not args.batch.is_dir():
+            print(f"❌ Batch folder not found: {args.batch}")
+            sys.exit(1)
+        sys.exit(0 if _run_batch(args) else 1)
     
-    if not script_text:
-        print(f"❌ Script file is empty")
+    # Validate and read script file
+    script_path = args.script
+    script_text = _read_script(script_path)
+    if script_text is None:
         sys.exit(1)
     
-    print(f"📄 Script loaded: {len(script_text)} characters")
-    
     # Set output path
     if args.output:
         output_path = args.output
@@ -566,48 +993,17 @@ Examples:
     print(f"📁 Using temp directory: {temp_dir}")
     
     try:
-        # Step 1: Generate voiceover
-        print(f"\n{'='*60}")
-        print("STEP 1: Generating Voiceover")
-        print(f"{'='*60}")
-        audio_path = temp_dir / "voiceover.mp3"
-        success, duration = generate_voiceover(script_text, audio_path, args.voice)
-        if not success:
-            print("❌ Failed to generate voiceover")
-            sys.exit(1)
-        
-        # Step 2: Compile background videos
-        print(f"\n{'='*60}")
-        print("STEP 2: Compiling Background Videos")
-        print(f"{'='*60}")
-        video_clip = compile_background_videos(args.video_folder, duration)
-        if video_clip is None:
-            print("❌ Failed to compile background videos")
-            sys.exit(1)
-        
-        # Step 3: Generate word timestamps
-        print(f"\n{'='*60}")
-        print("STEP 3: Extracting Word Timestamps")
-        print(f"{'='*60}")
-        word_timestamps = generate_word_timestamps(audio_path, args.whisper_model)
-        if word_timestamps is None:
-            print("❌ Failed to extract word timestamps")
-            sys.exit(1)
-        
-        # Step 4: Create ASS subtitles
-        print(f"\n{'='*60}")
-        print("STEP 4: Creating Subtitles")
-        print(f"{'='*60}")
-        subtitle_path = temp_dir / "subtitles.ass"
-        if not create_ass_subtitles(script_text, word_timestamps, subtitle_path):
-            print("❌ Failed to create subtitles")
+        prepared = _prepare_video(script_text, temp_dir, args.video_folder, args.whisper_model, args.voice)
+        if prepared is None:
             sys.exit(1)
+        background, audio_path, subtitle_path, duration = prepared
         
         # Step 5: Render final video
         print(f"\n{'='*60}")
         print("STEP 5: Rendering Final Video")
         print(f"{'='*60}")
-        if not render_final_video(video_clip, audio_path, subtitle_path, output_path):
+        if not render_final_video(background, audio_path, subtitle_path, output_path,
+                                  threads=args.ffmpeg_threads_per_invocation):
             print("❌ Failed to render final video")
             sys.exit(1)
         
@@ -620,11 +1016,8 @@ Examples:
     finally:
         # Cleanup temp directory
         import shutil
-        try:
-            shutil.rmtree(temp_dir)
-            print(f"\n🧹 Cleaned up temp files")
-        except:
-            pass
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        print(f"\n🧹 Cleaned up temp files")
 
 
 if __name__ == "__main__":